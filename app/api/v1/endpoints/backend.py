@@ -2,17 +2,19 @@
 Backend communication API endpoints for AgroBot backend integration
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, Request, status, BackgroundTasks
+from pydantic import ValidationError
 from typing import Dict, Any, List, Optional
 import logging
 import time
 import asyncio
+from dataclasses import asdict
 
 from app.core.mavlink.connection import MAVLinkManager
 from app.core.backend.client import BackendClient
 from app.models.backend import (
     SyncRequest, SyncResponse, RobotStatus, TelemetryData,
-    BackendConnection, DataUpload, CommandReceived
+    BackendConnection, DataUpload, CommandReceived, MSGPACK_CONTENT_TYPE, dump_json
 )
 from app.models.pixhawk import CommandResponse
 from config.settings import get_settings
@@ -123,7 +125,7 @@ async def sync_with_backend(
             background_tasks.add_task(process_backend_commands, sync_result["commands"], mavlink)
             commands_processed = len(sync_result["commands"])
         
-        return SyncResponse(
+        return SyncResponse.construct(
             success=sync_result["success"],
             message=sync_result.get("message", "Sync completed"),
             timestamp=time.time(),
@@ -164,7 +166,7 @@ async def update_robot_status(
         # Send to backend
         result = await backend_client.update_robot_status(status_data)
         
-        return CommandResponse(
+        return CommandResponse.construct(
             success=result["success"],
             message=result.get("message", "Status updated successfully"),
             data={"timestamp": time.time(), "status_data": status_data}
@@ -190,6 +192,36 @@ async def upload_telemetry_data(
     
     Sends telemetry data batch to the backend for storage and analysis.
     """
+    return await _upload_telemetry(data)
+
+
+@router.post("/telemetry/upload/msgpack", response_model=DataUpload)
+async def upload_telemetry_data_msgpack(request: Request) -> DataUpload:
+    """
+    Upload a MessagePack-encoded telemetry batch to backend
+    
+    Same as /telemetry/upload, with the body in the schema-driven binary
+    format produced by TelemetryData.to_msgpack (Content-Type: application/msgpack).
+    """
+    if request.headers.get("content-type", "").split(";")[0].strip() != MSGPACK_CONTENT_TYPE:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail=f"Expected Content-Type {MSGPACK_CONTENT_TYPE}"
+        )
+    
+    try:
+        data = TelemetryData.from_msgpack(await request.body())
+    except (ValueError, KeyError, TypeError, ValidationError) as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Invalid telemetry payload: {str(e)}"
+        )
+    
+    return await _upload_telemetry(data)
+
+
+async def _upload_telemetry(data: TelemetryData) -> DataUpload:
+    """Forward a telemetry batch to the backend, as MessagePack or JSON per settings"""
     try:
         if not backend_client:
             raise HTTPException(
@@ -198,13 +230,20 @@ async def upload_telemetry_data(
             )
         
         # Upload telemetry data
-        result = await backend_client.upload_telemetry(data.dict())
-        
-        return DataUpload(
+        if get_settings().BACKEND_TELEMETRY_MSGPACK:
+            payload = data.to_msgpack()
+            upload_size = len(payload)
+            result = await backend_client.upload_telemetry_msgpack(payload)
+        else:
+            payload = dump_json(data, exclude_none=True)
+            upload_size = len(payload)
+            result = await backend_client.upload_telemetry(payload)
+        
+        return DataUpload.construct(
             success=result["success"],
             message=result.get("message", "Telemetry uploaded successfully"),
             records_uploaded=len(data.data_points),
-            upload_size_bytes=len(str(data.dict())),
+            upload_size_bytes=upload_size,
             timestamp=time.time()
         )
         
@@ -264,12 +303,13 @@ async def acknowledge_command(command_id: str, result: CommandReceived) -> Comma
             )
         
         # Send acknowledgment to backend
-        ack_result = await backend_client.acknowledge_command(command_id, result.dict())
+        result_data = result.dict()
+        ack_result = await backend_client.acknowledge_command(command_id, result_data)
         
-        return CommandResponse(
+        return CommandResponse.construct(
             success=ack_result["success"],
             message=f"Command {command_id} acknowledged",
-            data={"command_id": command_id, "result": result.dict()}
+            data={"command_id": command_id, "result": result_data}
         )
         
     except HTTPException:
@@ -305,7 +345,7 @@ async def send_heartbeat() -> CommandResponse:
         
         result = await backend_client.send_heartbeat(heartbeat_data)
         
-        return CommandResponse(
+        return CommandResponse.construct(
             success=result["success"],
             message="Heartbeat sent successfully",
             data=heartbeat_data
@@ -381,7 +421,7 @@ async def update_configuration(config_update: Dict[str, Any]) -> CommandResponse
         # Send confirmation to backend
         result = await backend_client.confirm_config_update(config_update)
         
-        return CommandResponse(
+        return CommandResponse.construct(
             success=result["success"],
             message="Configuration updated successfully",
             data=config_update
@@ -492,13 +532,13 @@ async def get_telemetry_data(mavlink: MAVLinkManager) -> Dict[str, Any]:
     }
     
     if mavlink.latest_gps:
-        telemetry_data["gps_data"] = mavlink.latest_gps.__dict__
+        telemetry_data["gps_data"] = asdict(mavlink.latest_gps)
     
     if mavlink.latest_attitude:
-        telemetry_data["attitude_data"] = mavlink.latest_attitude.__dict__
+        telemetry_data["attitude_data"] = asdict(mavlink.latest_attitude)
     
     if mavlink.latest_heartbeat:
-        telemetry_data["system_status"] = mavlink.latest_heartbeat.__dict__
+        telemetry_data["system_status"] = asdict(mavlink.latest_heartbeat)
     
     return telemetry_data
 
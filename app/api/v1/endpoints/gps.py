@@ -48,7 +48,7 @@ async def get_current_position(
         
         gps = mavlink.latest_gps
         
-        return GPSPosition(
+        return GPSPosition.construct(
             latitude=gps.lat / 1e7,  # Convert from degrees * 1e7
             longitude=gps.lon / 1e7,
             altitude=gps.alt / 1000.0,  # Convert from mm to meters
@@ -86,7 +86,7 @@ async def get_gps_status(
             )
         
         if not mavlink.latest_gps:
-            return GPSStatus(
+            return GPSStatus.construct(
                 available=False,
                 fix_type=0,
                 satellites_visible=0,
@@ -111,7 +111,7 @@ async def get_gps_status(
             gps.hdop <= settings.GPS_MAX_HDOP
         )
         
-        return GPSStatus(
+        return GPSStatus.construct(
             available=True,
             fix_type=gps.fix_type,
             satellites_visible=gps.satellites_visible,
@@ -172,7 +172,7 @@ async def get_gps_accuracy(
         else:
             accuracy_class = "poor"
         
-        return GPSAccuracy(
+        return GPSAccuracy.construct(
             hdop=gps.hdop,
             vdop=gps.vdop,
             pdop=math.sqrt(gps.hdop**2 + gps.vdop**2),
@@ -230,7 +230,7 @@ async def get_gps_history(
                 )
                 total_distance += distance
         
-        return GPSHistory(
+        return GPSHistory.construct(
             positions=filtered_history,
             count=len(filtered_history),
             total_distance_meters=total_distance,
@@ -281,7 +281,7 @@ async def calculate_distance_to_coordinates(
         ground_speed = current_gps.vel / 100.0  # m/s
         estimated_time = distance / max(ground_speed, 1.0) if ground_speed > 0.1 else None
         
-        return DistanceResponse(
+        return DistanceResponse.construct(
             distance_meters=distance,
             bearing_degrees=bearing,
             estimated_travel_time_seconds=estimated_time,
@@ -321,7 +321,7 @@ async def get_geofence_status(
         settings = get_settings()
         
         if not settings.GEOFENCE_ENABLED:
-            return GeofenceStatus(
+            return GeofenceStatus.construct(
                 enabled=False,
                 inside_fence=True,
                 distance_to_fence=None,
@@ -353,7 +353,7 @@ async def get_geofence_status(
         inside_fence = distance_from_center <= settings.GEOFENCE_RADIUS
         distance_to_fence = settings.GEOFENCE_RADIUS - distance_from_center
         
-        return GeofenceStatus(
+        return GeofenceStatus.construct(
             enabled=True,
             inside_fence=inside_fence,
             distance_to_fence=distance_to_fence,
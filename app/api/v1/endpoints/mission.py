@@ -44,9 +44,10 @@ async def create_mission(waypoints: list):
 
 
 @router.post("/execute")
-async def execute_mission():
-    mission = mission_service.execute_mission()
-    return {"status": "executing", "mission": mission}
+async def execute_mission(mavlink: MAVLinkManager = Depends(get_mavlink_manager)):
+    uploaded = await mission_service.execute_mission(mavlink)
+    mission = mission_service.get_current_mission()
+    return {"status": "executing" if uploaded else "upload_failed", "mission": mission}
 
 
 @router.get("/list")
@@ -69,7 +70,7 @@ async def get_mission(mission_id: str) -> MissionResponse:
         
         mission_data = active_missions[mission_id]
         
-        return MissionResponse(
+        return MissionResponse.construct(
             success=True,
             message=f"Mission {mission_id} details",
             mission_id=mission_id,
@@ -254,7 +255,7 @@ async def get_mission_status() -> MissionExecutionStatus:
     """
     try:
         if not mission_execution_state["active"]:
-            return MissionExecutionStatus(
+            return MissionExecutionStatus.construct(
                 active=False,
                 mission_id=None,
                 current_waypoint=0,
@@ -280,7 +281,7 @@ async def get_mission_status() -> MissionExecutionStatus:
             total_estimated = mission_data["estimated_time"]
             estimated_remaining = max(0, total_estimated - elapsed_time)
         
-        return MissionExecutionStatus(
+        return MissionExecutionStatus.construct(
             active=True,
             mission_id=mission_id,
             current_waypoint=mission_execution_state["current_waypoint"],
@@ -359,7 +360,7 @@ async def create_square_pattern(
         
         active_missions[mission_id] = mission_data
         
-        return PatternResponse(
+        return PatternResponse.construct(
             success=True,
             message=f"Square pattern created with {len(waypoints)} waypoints",
             pattern_type="square",
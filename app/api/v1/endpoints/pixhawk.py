@@ -6,6 +6,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.responses import JSONResponse
 from typing import Dict, Any, Optional
 import logging
+from dataclasses import asdict
 
 from app.core.mavlink.connection import MAVLinkManager, MavlinkConnection
 from app.models.pixhawk import (
@@ -313,7 +314,7 @@ async def get_heartbeat(
             )
         
         return {
-            "heartbeat": mavlink.latest_heartbeat.__dict__,
+            "heartbeat": asdict(mavlink.latest_heartbeat),
             "age_seconds": time.time() - mavlink.latest_heartbeat.timestamp
         }
         
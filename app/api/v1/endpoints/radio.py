@@ -592,6 +592,7 @@ async def get_channels():
 
 
 @router.post("/failsafe")
-async def configure_failsafe(threshold: float):
-    failsafe.update_signal(threshold)
-    return {"status": "failsafe configured", "threshold": threshold}
\ No newline at end of file
+async def configure_failsafe(threshold: float, force: bool = False):
+    # A single reading never outlasts the loss debounce; force evaluates it directly
+    signal_lost = failsafe.update_signal(threshold, debounce=not force)
+    return {"status": "failsafe configured", "threshold": threshold, "signal_lost": signal_lost}
\ No newline at end of file
@@ -3,16 +3,36 @@ HTTP client for communicating with AgroBot backend
 """
 
 import asyncio
+import gzip
 import logging
 import time
-from typing import Dict, Any, List, Optional
+from collections import deque
+from typing import Dict, Any, List, Optional, Tuple, Union
 import httpx
-import json
+import orjson
 
+try:
+    import zstandard
+    # Reused for every body; requests are encoded one at a time on the event loop
+    _zstd_compressor = zstandard.ZstdCompressor(level=3)
+except ImportError:
+    _zstd_compressor = None
+
+from app.models.backend import MSGPACK_CONTENT_TYPE
 from config.settings import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Heartbeats kept while the backend is unreachable (oldest dropped first)
+_HEARTBEAT_BACKLOG = 60
+
+
+def _compress_body(content: bytes) -> Tuple[bytes, str]:
+    """Compress a request body, returning it with its Content-Encoding (zstd preferred)"""
+    if _zstd_compressor is not None:
+        return _zstd_compressor.compress(content), "zstd"
+    return gzip.compress(content, compresslevel=6), "gzip"
+
 
 class BackendClient:
     """HTTP client for AgroBot backend communication"""
@@ -23,9 +43,21 @@ class BackendClient:
         self.robot_id = robot_id
         self.settings = get_settings()
         
+        # Fixed per robot; the heartbeat body itself is a 3-key dict that
+        # orjson encodes faster than any hand-built byte template
+        self._heartbeat_endpoint = f"/api/robots/{robot_id}/heartbeat"
+        self._heartbeat_batch_endpoint = f"/api/robots/{robot_id}/heartbeat/batch"
+        
+        # Heartbeats not yet delivered, sent together with the next one when the
+        # backend supports batches (otherwise only the latest beat is kept)
+        self._heartbeat_backlog: deque = deque(
+            maxlen=_HEARTBEAT_BACKLOG if self.settings.BACKEND_HEARTBEAT_BATCH else 1
+        )
+        
         # Client configuration
         self.timeout = httpx.Timeout(self.settings.BACKEND_TIMEOUT)
         self.retry_attempts = self.settings.BACKEND_RETRY_ATTEMPTS
+        self.compress_min_bytes = self.settings.BACKEND_COMPRESSION_MIN_BYTES if self.settings.BACKEND_COMPRESSION else None
         
         # Connection tracking
         self.last_sync_time: Optional[float] = None
@@ -61,8 +93,16 @@ class BackendClient:
             await self._client.aclose()
             self._client = None
     
-    async def _make_request(self, method: str, endpoint: str, data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        """Make HTTP request with retry logic"""
+    async def _make_request(self, method: str, endpoint: str, data: Optional[Dict[str, Any]] = None,
+                            content: Optional[bytes] = None, content_type: Optional[str] = None) -> Dict[str, Any]:
+        """Make HTTP request with retry logic (POST/PUT send `content` as-is when given)"""
+        if content is None and data is not None and method.upper() in ("POST", "PUT"):
+            content = orjson.dumps(data)
+        # Bodies are JSON (dumped here or pre-encoded by the caller) unless stated
+        headers = {"Content-Type": content_type or "application/json"} if content is not None else {}
+        if content is not None and self.compress_min_bytes is not None and len(content) >= self.compress_min_bytes:
+            # Telemetry batches and log uploads are large and repetitive
+            content, headers["Content-Encoding"] = _compress_body(content)
         client = await self._get_client()
         url = f"{endpoint}"
         
@@ -73,9 +113,9 @@ class BackendClient:
                 if method.upper() == "GET":
                     response = await client.get(url, params=data)
                 elif method.upper() == "POST":
-                    response = await client.post(url, json=data)
+                    response = await client.post(url, content=content, headers=headers)
                 elif method.upper() == "PUT":
-                    response = await client.put(url, json=data)
+                    response = await client.put(url, content=content, headers=headers)
                 elif method.upper() == "DELETE":
                     response = await client.delete(url)
                 else:
@@ -85,7 +125,7 @@ class BackendClient:
                 if response.status_code == 200:
                     self.successful_requests += 1
                     self.connection_errors = 0
-                    return response.json()
+                    return orjson.loads(response.content)
                 elif response.status_code == 401:
                     raise Exception("Authentication failed - check API key")
                 elif response.status_code == 404:
@@ -231,10 +271,31 @@ class BackendClient:
                 "message": f"Status update failed: {str(e)}"
             }
     
-    async def upload_telemetry(self, telemetry_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Upload telemetry data to backend"""
+    async def upload_telemetry(self, telemetry_data: Union[Dict[str, Any], bytes]) -> Dict[str, Any]:
+        """Upload telemetry data (a dict, or an already encoded JSON body) to backend"""
         try:
-            response = await self._make_request("POST", "/api/telemetry", telemetry_data)
+            if isinstance(telemetry_data, bytes):
+                response = await self._make_request("POST", "/api/telemetry", content=telemetry_data)
+            else:
+                response = await self._make_request("POST", "/api/telemetry", telemetry_data)
+            return {
+                "success": True,
+                "message": "Telemetry uploaded successfully",
+                "records_processed": response.get("records_processed", 0)
+            }
+        except Exception as e:
+            logger.error(f"Telemetry upload failed: {e}")
+            return {
+                "success": False,
+                "message": f"Telemetry upload failed: {str(e)}"
+            }
+    
+    async def upload_telemetry_msgpack(self, payload: bytes) -> Dict[str, Any]:
+        """Upload a MessagePack-encoded telemetry batch (TelemetryData.to_msgpack) to backend"""
+        try:
+            response = await self._make_request(
+                "POST", "/api/telemetry", content=payload, content_type=MSGPACK_CONTENT_TYPE
+            )
             return {
                 "success": True,
                 "message": "Telemetry uploaded successfully",
@@ -279,16 +340,42 @@ class BackendClient:
             }
     
     async def send_heartbeat(self, heartbeat_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Send heartbeat to backend"""
+        """Send heartbeat to backend
+        
+        With BACKEND_HEARTBEAT_BATCH, heartbeats that could not be delivered are
+        kept and sent together with the next one in a single batch request. If
+        the batch request fails, the latest heartbeat goes to the single-beat
+        endpoint; when that works the backend has no batch support, so the
+        backlog is dropped and batching is turned off.
+        """
+        self._heartbeat_backlog.append(heartbeat_data)
+        batch = list(self._heartbeat_backlog)
         try:
-            response = await self._make_request("POST", f"/api/robots/{self.robot_id}/heartbeat", heartbeat_data)
+            if len(batch) > 1:
+                try:
+                    response = await self._make_request("POST", self._heartbeat_batch_endpoint, {
+                        "robot_id": self.robot_id,
+                        "heartbeats": batch
+                    })
+                except Exception as e:
+                    logger.warning(f"Heartbeat batch failed, sending latest only: {e}")
+                    batch = [heartbeat_data]
+                    response = await self._make_request("POST", self._heartbeat_endpoint, heartbeat_data)
+                    self._heartbeat_backlog = deque(maxlen=1)
+            else:
+                response = await self._make_request("POST", self._heartbeat_endpoint, heartbeat_data)
+            # Keep anything queued by a concurrent call while this one was in flight
+            delivered = {id(heartbeat) for heartbeat in batch}
+            while self._heartbeat_backlog and id(self._heartbeat_backlog[0]) in delivered:
+                self._heartbeat_backlog.popleft()
             return {
                 "success": True,
                 "message": "Heartbeat sent successfully",
+                "heartbeats_sent": len(batch),
                 "server_time": response.get("server_time")
             }
         except Exception as e:
-            logger.error(f"Heartbeat failed: {e}")
+            logger.error(f"Heartbeat failed ({len(self._heartbeat_backlog)} pending): {e}")
             return {
                 "success": False,
                 "message": f"Heartbeat failed: {str(e)}"
@@ -426,15 +513,11 @@ class BackendClient:
     
     def get_metrics(self) -> Dict[str, Any]:
         """Get client metrics"""
-        success_rate = 0.0
-        if self.total_requests > 0:
-            success_rate = (self.successful_requests / self.total_requests) * 100
-        
         return {
             "total_requests": self.total_requests,
             "successful_requests": self.successful_requests,
             "failed_requests": self.total_requests - self.successful_requests,
-            "success_rate": success_rate,
+            "success_rate": 100.0 * self.successful_requests / max(self.total_requests, 1),
             "connection_errors": self.connection_errors,
             "last_sync_time": self.last_sync_time,
             "base_url": self.base_url,
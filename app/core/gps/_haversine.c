@@ -0,0 +1,35 @@
+/*
+ * Haversine path-length kernel for app.core.gps.utils
+ *
+ * Build (loaded through cffi, falls back to NumPy when missing):
+ *   gcc -O3 -ffast-math -fopenmp-simd -shared -fPIC \
+ *       -o app/core/gps/_haversine.so app/core/gps/_haversine.c -lm
+ */
+
+#include <math.h>
+#include <stddef.h>
+
+#define DEG_TO_RAD 0.017453292519943295
+
+/*
+ * Sum of Haversine central angles (radians) between consecutive points.
+ * lat/lon are contiguous arrays of n coordinates in decimal degrees.
+ */
+void haversine_path(const double *lat, const double *lon, size_t n, double *out_total)
+{
+    double total = 0.0;
+    size_t i;
+
+    #pragma omp simd reduction(+:total)
+    for (i = 1; i < n; i++) {
+        double lat1 = lat[i - 1] * DEG_TO_RAD;
+        double lat2 = lat[i] * DEG_TO_RAD;
+        double sin_dlat = sin((lat2 - lat1) * 0.5);
+        double sin_dlon = sin((lon[i] - lon[i - 1]) * DEG_TO_RAD * 0.5);
+        double a = sin_dlat * sin_dlat + cos(lat1) * cos(lat2) * sin_dlon * sin_dlon;
+
+        total += 2.0 * asin(sqrt(a));
+    }
+
+    *out_total = total;
+}
@@ -6,16 +6,36 @@ import re
 import math
 import time
 import logging
-from typing import Dict, Any, Optional, List, Tuple
+from collections import deque
+from functools import reduce
+from itertools import islice
+from operator import xor
+from typing import Dict, Any, Optional, List, Tuple, Deque, Iterator, Union
 from dataclasses import dataclass
-from datetime import datetime, timezone
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# Hemisphere sign lookup for NMEA coordinate directions
+_SIGN_TBL = {'N': 1.0, 'S': -1.0, 'E': 1.0, 'W': -1.0}
+_INV60 = 1.0 / 60.0
+
+# Sentence body and optional two-digit checksum, matched in a single scan
+_SENTENCE_RE = re.compile(rb'\$([^*\r\n]+)(?:\*([0-9A-Fa-f]{2}))?\s*$')
+
+# NMEA 0183 limit for a sentence including '$' and CRLF
+_NMEA_MAX_LENGTH = 82
 
-@dataclass
+
+@dataclass(frozen=True)
 class GPSFix:
     """GPS fix data structure"""
+    __slots__ = (
+        'timestamp', 'latitude', 'longitude', 'altitude', 'speed', 'course',
+        'satellites', 'hdop', 'vdop', 'fix_type', 'fix_quality'
+    )
+    
     timestamp: float
     latitude: float
     longitude: float
@@ -29,9 +49,11 @@ class GPSFix:
     fix_quality: str
 
 
-@dataclass
+@dataclass(frozen=True)
 class NMEASentence:
     """NMEA sentence data structure"""
+    __slots__ = ('sentence_type', 'raw_data', 'timestamp', 'checksum_valid', 'fields')
+    
     sentence_type: str
     raw_data: str
     timestamp: float
@@ -42,7 +64,15 @@ class NMEASentence:
 class NMEAParser:
     """NMEA 0183 sentence parser"""
     
-    def __init__(self):
+    # Message part of the sentence type (talker ID stripped) -> handler index
+    _TYPE_IDS = {'GGA': 0, 'RMC': 1, 'GSA': 2, 'GSV': 3, 'VTG': 4, 'GLL': 5}
+    _TYPE_KEYS = frozenset(key.encode('ascii') for key in _TYPE_IDS)
+    
+    def __init__(self, strict_checksums: bool = False):
+        # When False, sentences without a handler are dropped before their
+        # checksum is validated
+        self.strict_checksums = strict_checksums
+        
         self.sentence_handlers = {
             'GPGGA': self._parse_gga,
             'GPRMC': self._parse_rmc,
@@ -52,10 +82,31 @@ class NMEAParser:
             'GPGLL': self._parse_gll
         }
         
+        # Handlers indexed by type ID; dispatch ignores the talker so that
+        # GN/GL/GA sentences from multi-GNSS receivers are handled as well
+        self._type_id = self._TYPE_IDS
+        self._handlers = (
+            self._parse_gga,
+            self._parse_rmc,
+            self._parse_gsa,
+            self._parse_gsv,
+            self._parse_vtg,
+            self._parse_gll
+        )
+        
+        # UTC midnight of the current day, refreshed when the day rolls over
+        self._midnight_day: Optional[int] = None
+        self._midnight_ts = 0
+        
+        # Bytes after the last newline of the previous buffer: a sentence the
+        # receiver had not finished sending, completed by the next read
+        self._partial = b''
+        
         # Parsing statistics
         self.sentences_parsed = 0
         self.sentences_failed = 0
         self.checksum_errors = 0
+        self.sentences_skipped = 0
         
     def parse_sentence(self, sentence: str) -> Optional[NMEASentence]:
         """
@@ -106,34 +157,189 @@ class NMEAParser:
             self.sentences_failed += 1
             return None
     
-    def _calculate_checksum(self, sentence: str) -> str:
+    def parse_sentence_bytes(self, buf: bytes) -> Optional[NMEASentence]:
+        """
+        Parse a single NMEA sentence straight from receiver bytes
+        
+        Args:
+            buf: Raw NMEA sentence bytes, optionally CRLF terminated
+            
+        Returns:
+            NMEASentence object or None if parsing failed
+        """
+        match = _SENTENCE_RE.match(buf)
+        if not match:
+            if buf.startswith(b'$'):
+                self.sentences_failed += 1
+            return None
+        
+        try:
+            body, checksum = match.group(1, 2)
+            
+            if checksum is not None:
+                checksum_valid = checksum.decode('ascii').upper() == self._calculate_checksum(body)
+                if not checksum_valid:
+                    self.checksum_errors += 1
+            else:
+                checksum_valid = True
+            
+            fields = body.decode('ascii').split(',')
+            
+            self.sentences_parsed += 1
+            
+            return NMEASentence(
+                sentence_type=fields[0],
+                raw_data=buf.decode('ascii').strip(),
+                timestamp=time.time(),
+                checksum_valid=checksum_valid,
+                fields=fields
+            )
+            
+        except Exception as e:
+            logger.debug(f"Error parsing NMEA sentence: {e}")
+            self.sentences_failed += 1
+            return None
+    
+    def _calculate_checksum(self, sentence: Union[str, bytes]) -> str:
         """Calculate NMEA checksum"""
-        checksum = 0
-        for char in sentence:
-            checksum ^= ord(char)
-        return f"{checksum:02X}"
+        if isinstance(sentence, str):
+            sentence = sentence.encode('ascii')
+        
+        # XOR 8 bytes at a time; zero padding does not change the result
+        padding = -len(sentence) % 8
+        if padding:
+            sentence += bytes(padding)
+        
+        checksum = reduce(xor, memoryview(sentence).cast('Q'), 0)
+        
+        # Fold the 64-bit word down to a single byte
+        checksum ^= checksum >> 32
+        checksum ^= checksum >> 16
+        checksum ^= checksum >> 8
+        return f"{checksum & 0xFF:02X}"
     
-    def parse_gps_data(self, sentence: str) -> Optional[Dict[str, Any]]:
+    def parse_gps_data(self, sentence: Union[str, bytes]) -> Optional[Dict[str, Any]]:
         """
         Parse NMEA sentence and extract GPS data
         
         Args:
-            sentence: Raw NMEA sentence
+            sentence: Raw NMEA sentence, as a string or as receiver bytes
             
         Returns:
             Dictionary with parsed GPS data or None
         """
-        nmea_sentence = self.parse_sentence(sentence)
+        if self._is_ignored(sentence):
+            self.sentences_skipped += 1
+            return None
+        
+        if isinstance(sentence, bytes):
+            nmea_sentence = self.parse_sentence_bytes(sentence)
+        else:
+            nmea_sentence = self.parse_sentence(sentence)
         if not nmea_sentence or not nmea_sentence.checksum_valid:
             return None
         
-        # Get appropriate handler
-        handler = self.sentence_handlers.get(nmea_sentence.sentence_type)
-        if handler:
+        return self._dispatch(nmea_sentence.sentence_type, nmea_sentence.fields)
+    
+    def parse_buffer(self, buf: bytes) -> List[Dict[str, Any]]:
+        """
+        Parse every NMEA sentence contained in a raw receiver buffer
+        
+        Checksums of all sentences are validated in a single vectorized pass.
+        Only newline-terminated sentences are parsed; a trailing partial
+        sentence is held back and completed by the next buffer.
+        
+        Args:
+            buf: Raw bytes as read from the GPS receiver
+            
+        Returns:
+            List of dictionaries with parsed GPS data, in sentence order
+        """
+        buf = self._partial + buf
+        end = buf.rfind(b'\n') + 1
+        if len(buf) - end > _NMEA_MAX_LENGTH:
+            # No terminator within a sentence length: line noise, not a sentence
+            self.sentences_failed += 1
+            self._partial = b''
+        else:
+            self._partial = buf[end:]
+        buf = buf[:end]
+        
+        bodies: List[bytes] = []
+        expected: List[int] = []
+        
+        for piece in buf.split(b'$'):
+            piece = piece.strip()
+            if not piece:
+                continue
+            
+            if not self.strict_checksums and piece[2:5] not in self._TYPE_KEYS:
+                self.sentences_skipped += 1
+                continue
+            
+            star = piece.find(b'*')
+            if star < 0:
+                # Complete line without a checksum; accepted as-is like parse_sentence does
+                bodies.append(piece)
+                expected.append(-1)
+                continue
+            
+            if star == 0:
+                self.sentences_failed += 1
+                continue
+            
             try:
-                return handler(nmea_sentence.fields)
-            except Exception as e:
-                logger.debug(f"Error parsing {nmea_sentence.sentence_type}: {e}")
+                checksum = int(piece[star + 1:star + 3], 16)
+            except ValueError:
+                self.sentences_failed += 1
+                continue
+            
+            bodies.append(piece[:star])
+            expected.append(checksum)
+        
+        if not bodies:
+            return []
+        
+        # XOR-reduce every sentence body in one pass over the concatenated bytes
+        starts = np.zeros(len(bodies), dtype=np.intp)
+        np.cumsum([len(body) for body in bodies[:-1]], out=starts[1:])
+        data = np.frombuffer(b''.join(bodies), dtype=np.uint8)
+        calculated = np.bitwise_xor.reduceat(data, starts)
+        
+        results = []
+        for body, checksum, value in zip(bodies, expected, calculated.tolist()):
+            self.sentences_parsed += 1
+            if checksum >= 0 and checksum != value:
+                self.checksum_errors += 1
+                continue
+            
+            fields = body.decode('ascii', errors='replace').split(',')
+            parsed = self._dispatch(fields[0], fields)
+            if parsed:
+                results.append(parsed)
+        
+        return results
+    
+    def _is_ignored(self, sentence: Union[str, bytes]) -> bool:
+        """Check if a sentence has no handler and can skip checksum validation"""
+        if self.strict_checksums or sentence[:1] not in ('$', b'$'):
+            return False
+        
+        key = sentence[3:6]
+        if isinstance(key, bytes):
+            return key not in self._TYPE_KEYS
+        return key not in self._type_id
+    
+    def _dispatch(self, sentence_type: str, fields: List[str]) -> Optional[Dict[str, Any]]:
+        """Run the handler registered for a sentence type"""
+        tid = self._type_id.get(sentence_type[2:5])
+        if tid is None:
+            return None
+        
+        try:
+            return self._handlers[tid](fields)
+        except Exception as e:
+            logger.debug(f"Error parsing {sentence_type}: {e}")
         
         return None
     
@@ -327,13 +533,8 @@ class NMEAParser:
                 degrees = int(coord_str[:2])
                 minutes = float(coord_str[2:])
             
-            decimal_degrees = degrees + minutes / 60.0
-            
             # Apply direction
-            if direction in ['S', 'W']:
-                decimal_degrees = -decimal_degrees
-            
-            return decimal_degrees
+            return _SIGN_TBL.get(direction, 1.0) * (degrees + minutes * _INV60)
             
         except (ValueError, IndexError):
             return None
@@ -349,10 +550,12 @@ class NMEAParser:
             seconds = float(time_str[4:])
             
             # Convert to timestamp (simplified - using current date)
-            now = datetime.now(timezone.utc)
-            time_today = now.replace(hour=hours, minute=minutes, second=int(seconds), microsecond=0)
+            day = int(time.time()) // 86400
+            if day != self._midnight_day:
+                self._midnight_day = day
+                self._midnight_ts = day * 86400
             
-            return time_today.timestamp()
+            return float(self._midnight_ts + hours * 3600 + minutes * 60 + int(seconds))
             
         except (ValueError, IndexError):
             return None
@@ -381,6 +584,7 @@ class NMEAParser:
             "sentences_parsed": self.sentences_parsed,
             "sentences_failed": self.sentences_failed,
             "checksum_errors": self.checksum_errors,
+            "sentences_skipped": self.sentences_skipped,
             "success_rate": success_rate,
             "supported_types": list(self.sentence_handlers.keys())
         }
@@ -392,20 +596,20 @@ class GPSDataProcessor:
     def __init__(self):
         self.parser = NMEAParser()
         self.current_fix = None
-        self.fix_history: List[GPSFix] = []
         self.max_history = 1000
+        self.fix_history: Deque[GPSFix] = deque(maxlen=self.max_history)
         
         # Data accumulation
         self.partial_data: Dict[str, Any] = {}
         self.last_update_time = 0
         self.update_threshold = 1.0  # seconds
         
-    def process_sentence(self, sentence: str) -> Optional[GPSFix]:
+    def process_sentence(self, sentence: Union[str, bytes]) -> Optional[GPSFix]:
         """
         Process NMEA sentence and potentially return complete GPS fix
         
         Args:
-            sentence: Raw NMEA sentence
+            sentence: Raw NMEA sentence, as a string or as receiver bytes
             
         Returns:
             GPSFix object if complete fix is available, None otherwise
@@ -417,18 +621,37 @@ class GPSDataProcessor:
         # Accumulate data from different sentence types
         self._accumulate_data(parsed_data)
         
-        # Check if we have enough data for a complete fix
+        return self._update_fix(time.time())
+    
+    def process_buffer(self, buf: bytes) -> List[GPSFix]:
+        """
+        Process a raw buffer containing multiple NMEA sentences
+        
+        Args:
+            buf: Raw bytes as read from the GPS receiver
+            
+        Returns:
+            List of GPSFix objects completed while processing the buffer
+        """
+        fixes = []
         current_time = time.time()
+        
+        for parsed_data in self.parser.parse_buffer(buf):
+            self._accumulate_data(parsed_data)
+            fix = self._update_fix(current_time)
+            if fix:
+                fixes.append(fix)
+        
+        return fixes
+    
+    def _update_fix(self, current_time: float) -> Optional[GPSFix]:
+        """Create a new fix from accumulated data if the update interval elapsed"""
         if current_time - self.last_update_time >= self.update_threshold:
             fix = self._create_fix()
             if fix:
                 self.current_fix = fix
                 self.fix_history.append(fix)
                 
-                # Limit history size
-                if len(self.fix_history) > self.max_history:
-                    self.fix_history = self.fix_history[-self.max_history:]
-                
                 self.last_update_time = current_time
                 return fix
         
@@ -515,9 +738,15 @@ class GPSDataProcessor:
         """Get the most recent GPS fix"""
         return self.current_fix
     
+    def iter_fix_history(self, limit: int = 100) -> Iterator[GPSFix]:
+        """Iterate over the most recent GPS fixes, newest first"""
+        return islice(reversed(self.fix_history), limit)
+    
     def get_fix_history(self, limit: int = 100) -> List[GPSFix]:
         """Get GPS fix history"""
-        return self.fix_history[-limit:]
+        history = list(self.iter_fix_history(limit))
+        history.reverse()
+        return history
     
     def get_statistics(self) -> Dict[str, Any]:
         """Get processor statistics"""
@@ -528,7 +757,7 @@ class GPSDataProcessor:
         avg_satellites = 0.0
         
         if fix_count > 0:
-            recent_fixes = self.fix_history[-100:]  # Last 100 fixes
+            recent_fixes = list(self.iter_fix_history(100))  # Last 100 fixes
             avg_accuracy = sum(fix.hdop for fix in recent_fixes) / len(recent_fixes)
             avg_satellites = sum(fix.satellites for fix in recent_fixes) / len(recent_fixes)
         
@@ -2,13 +2,42 @@
 GPS utility functions and coordinate transformations
 """
 
+import os
+import sys
 import math
 import time
 import logging
-from typing import List, Tuple, Dict, Any, Optional
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from typing import List, Tuple, Dict, Any, Optional, Union
 from dataclasses import dataclass
 from datetime import datetime, timezone
 
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+    
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when numba is not installed"""
+        def decorator(func):
+            return func
+        return decorator
+
+# Optional compiled path-length kernel (see _haversine.c for build instructions)
+try:
+    from cffi import FFI
+    
+    _ffi = FFI()
+    _ffi.cdef("void haversine_path(const double *lat, const double *lon, size_t n, double *out_total);")
+    _haversine_lib = _ffi.dlopen(os.path.join(os.path.dirname(os.path.abspath(__file__)), '_haversine.so'))
+except (ImportError, OSError):
+    _haversine_lib = None
+
 logger = logging.getLogger(__name__)
 
 # Earth constants
@@ -16,9 +45,25 @@ EARTH_RADIUS = 6371000  # meters
 WGS84_A = 6378137.0  # Semi-major axis
 WGS84_F = 1/298.257223563  # Flattening
 WGS84_E2 = 2*WGS84_F - WGS84_F**2  # First eccentricity squared
+WGS84_B = WGS84_A * (1 - WGS84_F)  # Semi-minor axis
+WGS84_A2_B2 = (WGS84_A**2 - WGS84_B**2) / WGS84_B**2  # Second eccentricity squared
 
+_TWO_PI = 2 * math.pi
 
-@dataclass
+# Rough spherical conversion between meters and degrees of latitude
+METERS_PER_DEGREE = 111320.0
+_DEGREES_PER_METER = 1.0 / METERS_PER_DEGREE
+
+# Below this range (meters) the equirectangular approximation is used for
+# geofence checks; its error stays under ~0.5% up to 60 degrees latitude
+EQUIRECT_MAX_RANGE = 10000
+
+
+# dataclass(slots=True) needs Python 3.10+; older interpreters get regular dataclasses
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class Coordinate:
     """GPS coordinate with metadata"""
     latitude: float
@@ -35,6 +80,8 @@ class Coordinate:
 @dataclass
 class BoundingBox:
     """Geographic bounding box"""
+    __slots__ = ('north', 'south', 'east', 'west')
+    
     north: float
     south: float
     east: float
@@ -52,10 +99,198 @@ class BoundingBox:
         return center_lat, center_lon
 
 
+# Record layout matching the waypoint dictionaries produced by PathUtils
+WAYPOINT_DTYPE = np.dtype([
+    ('latitude', 'f8'),
+    ('longitude', 'f8'),
+    ('altitude', 'f8'),
+    ('sequence', 'i4')
+])
+
+
+class WaypointBuffer:
+    """Waypoints stored as contiguous latitude/longitude/altitude arrays"""
+    __slots__ = ('lats', 'lons', 'alts')
+    
+    def __init__(self, lats, lons, alts, dtype=np.float64):
+        self.lats = np.asarray(lats, dtype=dtype)
+        self.lons = np.asarray(lons, dtype=dtype)
+        self.alts = np.broadcast_to(np.asarray(alts, dtype=dtype), self.lats.shape)
+    
+    def __len__(self) -> int:
+        return len(self.lats)
+    
+    @classmethod
+    def from_dicts(cls, waypoints: List[Dict[str, Any]]) -> 'WaypointBuffer':
+        """Create a buffer from waypoint dictionaries"""
+        return cls(
+            [wp['latitude'] for wp in waypoints],
+            [wp['longitude'] for wp in waypoints],
+            [wp.get('altitude', 0.0) for wp in waypoints]
+        )
+    
+    def to_records(self) -> np.recarray:
+        """
+        Convert to a preallocated record array with WAYPOINT_DTYPE fields
+        
+        Lets callers iterate or index waypoints by field name without
+        building one dictionary per waypoint.
+        """
+        records = np.recarray(len(self.lats), dtype=WAYPOINT_DTYPE)
+        records.latitude = self.lats
+        records.longitude = self.lons
+        records.altitude = self.alts
+        records.sequence = np.arange(len(self.lats))
+        return records
+    
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """Convert to waypoint dictionaries, sequenced in buffer order"""
+        return [
+            {
+                'latitude': lat,
+                'longitude': lon,
+                'altitude': alt,
+                'sequence': sequence
+            }
+            for sequence, (lat, lon, alt) in enumerate(zip(self.lats.tolist(), self.lons.tolist(), self.alts.tolist()))
+        ]
+
+
+def meters_to_degrees(lat: float, dx_m: float, dy_m: float) -> Tuple[float, float]:
+    """
+    Convert east/north offsets in meters to degrees (rough approximation)
+    
+    Args:
+        lat: Latitude at which the offsets apply
+        dx_m: East offset in meters
+        dy_m: North offset in meters
+        
+    Returns:
+        Offsets as (delta_latitude, delta_longitude) in degrees
+    """
+    return dy_m * _DEGREES_PER_METER, dx_m * _DEGREES_PER_METER / math.cos(math.radians(lat))
+
+
+def _sincos(x: float) -> Tuple[float, float]:
+    """Sine and cosine of x"""
+    return math.sin(x), math.cos(x)
+
+
+def _equirect_angle_sq(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Squared equirectangular angular distance (radians^2)"""
+    x = math.radians(lon2 - lon1) * math.cos(math.radians((lat1 + lat2) / 2))
+    y = math.radians(lat2 - lat1)
+    return x * x + y * y
+
+
+def _haversine_a(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Haversine 'a' term, i.e. sin^2 of half the central angle"""
+    sin_dlat = math.sin(math.radians(lat2 - lat1) / 2)
+    sin_dlon = math.sin(math.radians(lon2 - lon1) / 2)
+    return (sin_dlat * sin_dlat +
+            math.cos(math.radians(lat1)) * math.cos(math.radians(lat2)) * sin_dlon * sin_dlon)
+
+
+@lru_cache(maxsize=128)
+def _haversine_a_limit(radius: float) -> float:
+    """Haversine 'a' term corresponding to a distance of radius meters"""
+    if radius < 0:
+        return -1.0
+    if radius >= math.pi * EARTH_RADIUS:
+        return 1.0
+    s = math.sin(radius / (2 * EARTH_RADIUS))
+    return s * s
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _path_angle_sum(lats: np.ndarray, lons: np.ndarray) -> float:
+    """Sum of Haversine central angles (radians) along a path"""
+    acc = 0.0
+    for i in prange(1, lats.shape[0]):
+        lat1 = math.radians(lats[i - 1])
+        lat2 = math.radians(lats[i])
+        sin_dlat = math.sin((lat2 - lat1) / 2)
+        sin_dlon = math.sin(math.radians(lons[i] - lons[i - 1]) / 2)
+        a = sin_dlat * sin_dlat + math.cos(lat1) * math.cos(lat2) * sin_dlon * sin_dlon
+        acc += 2 * math.asin(math.sqrt(a))
+    return acc
+
+
+@njit(cache=True, fastmath=True)
+def _vincenty_core(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Vincenty inverse formula on the WGS84 ellipsoid"""
+    # Module constants are frozen into the compiled kernel
+    f = WGS84_F
+    b = WGS84_B
+    
+    # Convert to radians
+    lat1_rad = math.radians(lat1)
+    lat2_rad = math.radians(lat2)
+    delta_lon = math.radians(lon2 - lon1)
+    
+    L = delta_lon
+    U1 = math.atan((1 - f) * math.tan(lat1_rad))
+    U2 = math.atan((1 - f) * math.tan(lat2_rad))
+    
+    sin_U1 = math.sin(U1)
+    cos_U1 = math.cos(U1)
+    sin_U2 = math.sin(U2)
+    cos_U2 = math.cos(U2)
+    
+    lambda_val = L
+    lambda_prev = _TWO_PI
+    iter_limit = 100
+    
+    sin_sigma = 0.0
+    cos_sigma = 0.0
+    sigma = 0.0
+    cos2_alpha = 0.0
+    cos_2sigma_m = 0.0
+    
+    while abs(lambda_val - lambda_prev) > 1e-12 and iter_limit > 0:
+        sin_lambda = math.sin(lambda_val)
+        cos_lambda = math.cos(lambda_val)
+        
+        sin_sigma = math.hypot(cos_U2 * sin_lambda,
+                               cos_U1 * sin_U2 - sin_U1 * cos_U2 * cos_lambda)
+        
+        if sin_sigma == 0:
+            return 0.0  # Coincident points
+        
+        cos_sigma = sin_U1 * sin_U2 + cos_U1 * cos_U2 * cos_lambda
+        sigma = math.atan2(sin_sigma, cos_sigma)
+        
+        sin_alpha = cos_U1 * cos_U2 * sin_lambda / sin_sigma
+        cos2_alpha = 1 - sin_alpha ** 2
+        
+        cos_2sigma_m = cos_sigma - 2 * sin_U1 * sin_U2 / cos2_alpha
+        
+        C = f / 16 * cos2_alpha * (4 + f * (4 - 3 * cos2_alpha))
+        
+        lambda_prev = lambda_val
+        lambda_val = L + (1 - C) * f * sin_alpha * \
+                   (sigma + C * sin_sigma * (cos_2sigma_m + C * cos_sigma * (-1 + 2 * cos_2sigma_m ** 2)))
+        
+        iter_limit -= 1
+    
+    if iter_limit == 0:
+        return math.nan  # Formula failed to converge
+    
+    u2 = cos2_alpha * WGS84_A2_B2
+    A = 1 + u2 / 16384 * (4096 + u2 * (-768 + u2 * (320 - 175 * u2)))
+    B = u2 / 1024 * (256 + u2 * (-128 + u2 * (74 - 47 * u2)))
+    
+    delta_sigma = B * sin_sigma * (cos_2sigma_m + B / 4 * (cos_sigma * (-1 + 2 * cos_2sigma_m ** 2) -
+                                                         B / 6 * cos_2sigma_m * (-3 + 4 * sin_sigma ** 2) * (-3 + 4 * cos_2sigma_m ** 2)))
+    
+    return b * A * (sigma - delta_sigma)
+
+
 class CoordinateConverter:
     """Coordinate system conversions"""
     
     @staticmethod
+    @lru_cache(maxsize=2048)
     def decimal_to_dms(decimal_degrees: float) -> Tuple[int, int, float]:
         """
         Convert decimal degrees to degrees, minutes, seconds
@@ -112,7 +347,14 @@ class CoordinateConverter:
         if format_type == 'decimal':
             return f"{lat:.6f}, {lon:.6f}"
         
-        elif format_type == 'dms':
+        # Round to GPS precision so repeated positions hit the cache
+        return CoordinateConverter._format_coordinate_cached(round(lat, 7), round(lon, 7), format_type)
+    
+    @staticmethod
+    @lru_cache(maxsize=2048)
+    def _format_coordinate_cached(lat: float, lon: float, format_type: str) -> str:
+        """Format coordinates in DMS/DM notation (cached)"""
+        if format_type == 'dms':
             lat_d, lat_m, lat_s = CoordinateConverter.decimal_to_dms(lat)
             lon_d, lon_m, lon_s = CoordinateConverter.decimal_to_dms(lon)
             lat_dir = 'N' if lat >= 0 else 'S'
@@ -157,18 +399,22 @@ class DistanceCalculator:
         delta_lon = math.radians(lon2 - lon1)
         
         # Haversine formula
-        a = (math.sin(delta_lat / 2) * math.sin(delta_lat / 2) +
-             math.cos(lat1_rad) * math.cos(lat2_rad) *
-             math.sin(delta_lon / 2) * math.sin(delta_lon / 2))
+        sin_dlat = math.sin(delta_lat / 2)
+        sin_dlon = math.sin(delta_lon / 2)
+        a = (sin_dlat * sin_dlat +
+             math.cos(lat1_rad) * math.cos(lat2_rad) * sin_dlon * sin_dlon)
         
         c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
         
         return EARTH_RADIUS * c
     
     @staticmethod
-    def vincenty_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    def equirect_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
         """
-        Calculate distance using Vincenty's formula (more accurate)
+        Calculate distance using the equirectangular approximation
+        
+        Much cheaper than Haversine and accurate to a few centimeters over
+        short ranges; use haversine_distance for long distances.
         
         Args:
             lat1, lon1: First point coordinates
@@ -177,68 +423,53 @@ class DistanceCalculator:
         Returns:
             Distance in meters
         """
-        # Convert to radians
-        lat1_rad = math.radians(lat1)
-        lat2_rad = math.radians(lat2)
-        delta_lon = math.radians(lon2 - lon1)
-        
-        # Vincenty's formula
-        a = WGS84_A
-        b = a * (1 - WGS84_F)
-        f = WGS84_F
-        
-        L = delta_lon
-        U1 = math.atan((1 - f) * math.tan(lat1_rad))
-        U2 = math.atan((1 - f) * math.tan(lat2_rad))
-        
-        sin_U1 = math.sin(U1)
-        cos_U1 = math.cos(U1)
-        sin_U2 = math.sin(U2)
-        cos_U2 = math.cos(U2)
+        return EARTH_RADIUS * math.sqrt(_equirect_angle_sq(lat1, lon1, lat2, lon2))
+    
+    @staticmethod
+    def haversine_distance_array(lats1, lons1, lats2, lons2, dtype=np.float64) -> np.ndarray:
+        """
+        Calculate element-wise Haversine distances for arrays of points
         
-        lambda_val = L
-        lambda_prev = 2 * math.pi
-        iter_limit = 100
+        Passing dtype=np.float32 halves memory traffic on long paths; float32
+        resolves coordinates to roughly 0.5 m, so each distance carries up to
+        about that much error.
         
-        while abs(lambda_val - lambda_prev) > 1e-12 and iter_limit > 0:
-            sin_lambda = math.sin(lambda_val)
-            cos_lambda = math.cos(lambda_val)
-            
-            sin_sigma = math.sqrt((cos_U2 * sin_lambda) ** 2 +
-                                (cos_U1 * sin_U2 - sin_U1 * cos_U2 * cos_lambda) ** 2)
-            
-            if sin_sigma == 0:
-                return 0  # Coincident points
-            
-            cos_sigma = sin_U1 * sin_U2 + cos_U1 * cos_U2 * cos_lambda
-            sigma = math.atan2(sin_sigma, cos_sigma)
-            
-            sin_alpha = cos_U1 * cos_U2 * sin_lambda / sin_sigma
-            cos2_alpha = 1 - sin_alpha ** 2
-            
-            cos_2sigma_m = cos_sigma - 2 * sin_U1 * sin_U2 / cos2_alpha
-            
-            C = f / 16 * cos2_alpha * (4 + f * (4 - 3 * cos2_alpha))
-            
-            lambda_prev = lambda_val
-            lambda_val = L + (1 - C) * f * sin_alpha * \
-                       (sigma + C * sin_sigma * (cos_2sigma_m + C * cos_sigma * (-1 + 2 * cos_2sigma_m ** 2)))
+        Args:
+            lats1, lons1: First point coordinates (array-like)
+            lats2, lons2: Second point coordinates (array-like)
+            dtype: Floating point type used for the computation
             
-            iter_limit -= 1
-        
-        if iter_limit == 0:
-            return float('nan')  # Formula failed to converge
+        Returns:
+            Array of distances in meters
+        """
+        lats1 = np.asarray(lats1, dtype=dtype)
+        lats2 = np.asarray(lats2, dtype=dtype)
+        lat1_rad = np.radians(lats1)
+        lat2_rad = np.radians(lats2)
+        delta_lat = np.radians(lats2 - lats1)
+        delta_lon = np.radians(np.asarray(lons2, dtype=dtype) - np.asarray(lons1, dtype=dtype))
         
-        u2 = cos2_alpha * (a ** 2 - b ** 2) / (b ** 2)
-        A = 1 + u2 / 16384 * (4096 + u2 * (-768 + u2 * (320 - 175 * u2)))
-        B = u2 / 1024 * (256 + u2 * (-128 + u2 * (74 - 47 * u2)))
+        a = (np.sin(delta_lat / 2) ** 2 +
+             np.cos(lat1_rad) * np.cos(lat2_rad) * np.sin(delta_lon / 2) ** 2)
         
-        delta_sigma = B * sin_sigma * (cos_2sigma_m + B / 4 * (cos_sigma * (-1 + 2 * cos_2sigma_m ** 2) -
-                                                             B / 6 * cos_2sigma_m * (-3 + 4 * sin_sigma ** 2) * (-3 + 4 * cos_2sigma_m ** 2)))
+        # Equivalent to 2 * atan2(sqrt(a), sqrt(1 - a))
+        c = 2 * np.arcsin(np.sqrt(a))
         
-        distance = b * A * (sigma - delta_sigma)
+        return EARTH_RADIUS * c
+    
+    @staticmethod
+    def vincenty_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+        """
+        Calculate distance using Vincenty's formula (more accurate)
         
-        return distance
+        Args:
+            lat1, lon1: First point coordinates
+            lat2, lon2: Second point coordinates
+            
+        Returns:
+            Distance in meters
+        """
+        return _vincenty_core(lat1, lon1, lat2, lon2)
     
     @staticmethod
     def bearing(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
@@ -256,13 +487,18 @@ class DistanceCalculator:
         lat2_rad = math.radians(lat2)
         delta_lon = math.radians(lon2 - lon1)
         
-        y = math.sin(delta_lon) * math.cos(lat2_rad)
-        x = (math.cos(lat1_rad) * math.sin(lat2_rad) -
-             math.sin(lat1_rad) * math.cos(lat2_rad) * math.cos(delta_lon))
+        sin_lat1, cos_lat1 = _sincos(lat1_rad)
+        sin_lat2, cos_lat2 = _sincos(lat2_rad)
+        sin_dlon, cos_dlon = _sincos(delta_lon)
+        
+        y = sin_dlon * cos_lat2
+        x = cos_lat1 * sin_lat2 - sin_lat1 * cos_lat2 * cos_dlon
         
         bearing = math.atan2(y, x)
-        bearing = math.degrees(bearing)
-        bearing = (bearing + 360) % 360  # Normalize to 0-360
+        bearing = math.degrees(bearing) % 360  # Normalize to 0-360
+        if bearing >= 360.0:
+            # A tiny negative angle rounds up to 360 under the modulo
+            bearing = 0.0
         
         return bearing
     
@@ -286,19 +522,52 @@ class DistanceCalculator:
         # Angular distance
         angular_distance = distance / EARTH_RADIUS
         
+        sin_lat, cos_lat = _sincos(lat_rad)
+        sin_ad, cos_ad = _sincos(angular_distance)
+        sin_bearing, cos_bearing = _sincos(bearing_rad)
+        
         # Calculate destination
-        dest_lat = math.asin(
-            math.sin(lat_rad) * math.cos(angular_distance) +
-            math.cos(lat_rad) * math.sin(angular_distance) * math.cos(bearing_rad)
-        )
+        dest_lat = math.asin(sin_lat * cos_ad + cos_lat * sin_ad * cos_bearing)
         
         dest_lon = lon_rad + math.atan2(
-            math.sin(bearing_rad) * math.sin(angular_distance) * math.cos(lat_rad),
-            math.cos(angular_distance) - math.sin(lat_rad) * math.sin(dest_lat)
+            sin_bearing * sin_ad * cos_lat,
+            cos_ad - sin_lat * math.sin(dest_lat)
         )
         
         return math.degrees(dest_lat), math.degrees(dest_lon)
     
+    @staticmethod
+    def destination_point_batch(lat: float, lon: float, bearings, distances) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Calculate destination points for many bearings and distances from a single start point
+        
+        Args:
+            lat, lon: Start point coordinates
+            bearings: Bearings in degrees (array-like)
+            distances: Distances in meters (array-like or scalar, broadcast against bearings)
+            
+        Returns:
+            Destination points as (latitudes, longitudes) arrays
+        """
+        lat_rad = math.radians(lat)
+        lon_rad = math.radians(lon)
+        bearings_rad = np.radians(bearings)
+        
+        sin_lat, cos_lat = _sincos(lat_rad)
+        
+        # Angular distances
+        angular_distances = np.asarray(distances, dtype=np.float64) / EARTH_RADIUS
+        sin_ad = np.sin(angular_distances)
+        cos_ad = np.cos(angular_distances)
+        
+        dest_lat = np.arcsin(sin_lat * cos_ad + cos_lat * sin_ad * np.cos(bearings_rad))
+        dest_lon = lon_rad + np.arctan2(
+            np.sin(bearings_rad) * sin_ad * cos_lat,
+            cos_ad - sin_lat * np.sin(dest_lat)
+        )
+        
+        return np.degrees(dest_lat), np.degrees(dest_lon)
+    
     @staticmethod
     def midpoint(lat1: float, lon1: float, lat2: float, lon2: float) -> Tuple[float, float]:
         """
@@ -315,19 +584,71 @@ class DistanceCalculator:
         lat2_rad = math.radians(lat2)
         delta_lon = math.radians(lon2 - lon1)
         
-        bx = math.cos(lat2_rad) * math.cos(delta_lon)
-        by = math.cos(lat2_rad) * math.sin(delta_lon)
+        sin_lat1, cos_lat1 = _sincos(lat1_rad)
+        sin_lat2, cos_lat2 = _sincos(lat2_rad)
+        sin_dlon, cos_dlon = _sincos(delta_lon)
         
-        lat3 = math.atan2(
-            math.sin(lat1_rad) + math.sin(lat2_rad),
-            math.sqrt((math.cos(lat1_rad) + bx) * (math.cos(lat1_rad) + bx) + by * by)
-        )
+        bx = cos_lat2 * cos_dlon
+        by = cos_lat2 * sin_dlon
+        cos_lat1_bx = cos_lat1 + bx
+        
+        lat3 = math.atan2(sin_lat1 + sin_lat2, math.hypot(cos_lat1_bx, by))
         
-        lon3 = math.radians(lon1) + math.atan2(by, math.cos(lat1_rad) + bx)
+        lon3 = math.radians(lon1) + math.atan2(by, cos_lat1_bx)
         
         return math.degrees(lat3), math.degrees(lon3)
 
 
+class Geofence:
+    """Polygon geofence with precomputed edges for repeated containment checks"""
+    
+    def __init__(self, polygon: List[Tuple[float, float]], dtype=np.float64):
+        """
+        Args:
+            polygon: List of (lat, lon) tuples (or an N x 2 array) defining polygon vertices
+            dtype: Floating point type for the edge arrays; np.float32 halves
+                memory use for large polygons at ~0.5 m vertex resolution
+        """
+        self.vertices = np.asarray(polygon, dtype=dtype)
+        
+        # Edge i runs from vertex i to vertex i + 1 (wrapping around)
+        self._y1 = self.vertices[:, 0]
+        self._x1 = self.vertices[:, 1]
+        y2 = np.roll(self._y1, -1)
+        x2 = np.roll(self._x1, -1)
+        self._y2 = y2
+        self._dx = x2 - self._x1
+        dy = y2 - self._y1
+        self._dy_inv = 1 / np.where(dy == 0, 1, dy)
+        
+        self.bounds = BoundingBox(
+            north=float(self._y1.max()),
+            south=float(self._y1.min()),
+            east=float(self._x1.max()),
+            west=float(self._x1.min())
+        )
+    
+    def contains(self, lat: float, lon: float) -> bool:
+        """
+        Check if point is within the geofence using ray casting
+        
+        Args:
+            lat, lon: Point to check
+            
+        Returns:
+            True if point is inside the polygon
+        """
+        if not self.bounds.contains(lat, lon):
+            return False
+        
+        # Edges straddling the point's latitude, and where they cross it
+        straddles = (self._y1 > lat) != (self._y2 > lat)
+        x_intersections = (lat - self._y1) * self._dx * self._dy_inv + self._x1
+        
+        crossings = np.count_nonzero(straddles & (lon < x_intersections))
+        return bool(crossings & 1)
+
+
 class GeofenceUtils:
     """Geofence utility functions"""
     
@@ -345,38 +666,29 @@ class GeofenceUtils:
         Returns:
             True if point is inside geofence
         """
-        distance = DistanceCalculator.haversine_distance(lat, lon, center_lat, center_lon)
-        return distance <= radius
+        # Compare squared angular distances to avoid sqrt/atan2 per query
+        if radius < EQUIRECT_MAX_RANGE:
+            angle = radius / EARTH_RADIUS
+            return radius >= 0 and _equirect_angle_sq(lat, lon, center_lat, center_lon) <= angle * angle
+        
+        return _haversine_a(lat, lon, center_lat, center_lon) <= _haversine_a_limit(radius)
     
     @staticmethod
     def point_in_polygon(lat: float, lon: float, polygon: List[Tuple[float, float]]) -> bool:
         """
         Check if point is within polygon geofence using ray casting
         
+        For repeated checks against the same polygon, build a Geofence once
+        and call Geofence.contains instead.
+        
         Args:
             lat, lon: Point to check
-            polygon: List of (lat, lon) tuples defining polygon vertices
+            polygon: List of (lat, lon) tuples (or an N x 2 array) defining polygon vertices
             
         Returns:
             True if point is inside polygon
         """
-        x, y = lon, lat
-        n = len(polygon)
-        inside = False
-        
-        p1x, p1y = polygon[0]
-        for i in range(1, n + 1):
-            p2x, p2y = polygon[i % n]
-            if y > min(p1y, p2y):
-                if y <= max(p1y, p2y):
-                    if x <= max(p1x, p2x):
-                        if p1y != p2y:
-                            xinters = (y - p1y) * (p2x - p1x) / (p2y - p1y) + p1x
-                        if p1x == p2x or x <= xinters:
-                            inside = not inside
-            p1x, p1y = p2x, p2y
-        
-        return inside
+        return Geofence(polygon).contains(lat, lon)
     
     @staticmethod
     def distance_to_boundary(lat: float, lon: float, center_lat: float,
@@ -400,12 +712,12 @@ class PathUtils:
     """Path planning and optimization utilities"""
     
     @staticmethod
-    def calculate_path_length(waypoints: List[Tuple[float, float]]) -> float:
+    def calculate_path_length(waypoints: Union[List[Tuple[float, float]], WaypointBuffer]) -> float:
         """
         Calculate total path length for list of waypoints
         
         Args:
-            waypoints: List of (lat, lon) tuples
+            waypoints: List of (lat, lon) tuples, or a WaypointBuffer
             
         Returns:
             Total path length in meters
@@ -413,15 +725,34 @@ class PathUtils:
         if len(waypoints) < 2:
             return 0.0
         
-        total_distance = 0.0
-        for i in range(1, len(waypoints)):
-            prev_lat, prev_lon = waypoints[i-1]
-            curr_lat, curr_lon = waypoints[i]
-            
-            distance = DistanceCalculator.haversine_distance(prev_lat, prev_lon, curr_lat, curr_lon)
-            total_distance += distance
-        
-        return total_distance
+        if isinstance(waypoints, WaypointBuffer):
+            lats = waypoints.lats
+            lons = waypoints.lons
+        else:
+            points = np.asarray(waypoints, dtype=np.float64)
+            lats = points[:, 0]
+            lons = points[:, 1]
+        
+        if _haversine_lib is not None:
+            lats = np.ascontiguousarray(lats, dtype=np.float64)
+            lons = np.ascontiguousarray(lons, dtype=np.float64)
+            total = _ffi.new("double *")
+            _haversine_lib.haversine_path(
+                _ffi.from_buffer("double[]", lats),
+                _ffi.from_buffer("double[]", lons),
+                len(lats),
+                total
+            )
+            return float(EARTH_RADIUS * total[0])
+        
+        if NUMBA_AVAILABLE:
+            # Fused, multi-threaded reduction without temporary arrays
+            angle = _path_angle_sum(np.ascontiguousarray(lats), np.ascontiguousarray(lons))
+            return float(EARTH_RADIUS * angle)
+        
+        distances = DistanceCalculator.haversine_distance_array(lats[:-1], lons[:-1], lats[1:], lons[1:])
+        
+        return float(distances.sum())
     
     @staticmethod
     def simplify_path(waypoints: List[Tuple[float, float]], tolerance: float = 2.0) -> List[Tuple[float, float]]:
@@ -439,50 +770,42 @@ class PathUtils:
             return waypoints
         
         # Convert tolerance from meters to degrees (rough approximation)
-        tolerance_deg = tolerance / 111320  # meters per degree at equator
-        
-        def perpendicular_distance(point: Tuple[float, float], line_start: Tuple[float, float], 
-                                 line_end: Tuple[float, float]) -> float:
-            """Calculate perpendicular distance from point to line"""
-            x0, y0 = point
-            x1, y1 = line_start
-            x2, y2 = line_end
-            
-            if x1 == x2 and y1 == y2:
-                return math.sqrt((x0 - x1)**2 + (y0 - y1)**2)
-            
-            num = abs((y2 - y1) * x0 - (x2 - x1) * y0 + x2 * y1 - y2 * x1)
-            den = math.sqrt((y2 - y1)**2 + (x2 - x1)**2)
-            
-            return num / den
-        
-        def douglas_peucker(points: List[Tuple[float, float]], epsilon: float) -> List[Tuple[float, float]]:
-            """Douglas-Peucker simplification algorithm"""
-            if len(points) <= 2:
-                return points
-            
-            # Find the point with maximum distance
-            max_distance = 0
-            max_index = 0
-            
-            for i in range(1, len(points) - 1):
-                distance = perpendicular_distance(points[i], points[0], points[-1])
-                if distance > max_distance:
-                    max_distance = distance
-                    max_index = i
-            
-            # If max distance is greater than epsilon, recursively simplify
-            if max_distance > epsilon:
-                # Recursive call
-                left_part = douglas_peucker(points[:max_index + 1], epsilon)
-                right_part = douglas_peucker(points[max_index:], epsilon)
-                
-                # Combine results
-                return left_part[:-1] + right_part
+        tolerance_deg = tolerance * _DEGREES_PER_METER  # meters per degree at equator
+        
+        points = np.asarray(waypoints, dtype=np.float64)
+        n = len(points)
+        
+        keep = np.zeros(n, dtype=bool)
+        keep[0] = keep[-1] = True
+        
+        # Iterative Douglas-Peucker over (start, end) index segments
+        stack = [(0, n - 1)]
+        while stack:
+            start, end = stack.pop()
+            if end - start < 2:
+                continue
+            
+            x1, y1 = points[start]
+            x2, y2 = points[end]
+            dx = x2 - x1
+            dy = y2 - y1
+            
+            # Perpendicular distance of every interior point to the segment
+            segment = points[start + 1:end]
+            den = math.hypot(dx, dy)
+            if den == 0:
+                distances = np.hypot(segment[:, 0] - x1, segment[:, 1] - y1)
             else:
-                return [points[0], points[-1]]
+                distances = np.abs(dy * (segment[:, 0] - x1) - dx * (segment[:, 1] - y1)) / den
+            
+            index = int(distances.argmax())
+            if distances[index] > tolerance_deg:
+                max_index = start + 1 + index
+                keep[max_index] = True
+                stack.append((max_index, end))
+                stack.append((start, max_index))
         
-        return douglas_peucker(waypoints, tolerance_deg)
+        return [waypoints[i] for i in np.flatnonzero(keep)]
     
     @staticmethod
     def generate_grid_waypoints(bounds: BoundingBox, spacing: float, 
@@ -498,42 +821,43 @@ class PathUtils:
         Returns:
             List of waypoint dictionaries
         """
-        waypoints = []
-        
-        # Convert spacing from meters to degrees (rough approximation)
-        lat_spacing = spacing / 111320  # meters per degree latitude
-        lon_spacing = spacing / (111320 * math.cos(math.radians(bounds.center()[0])))  # adjust for longitude
-        
-        # Generate grid points
-        lat = bounds.south
-        row = 0
-        
-        while lat <= bounds.north:
-            if row % 2 == 0:  # Left to right
-                lon = bounds.west
-                while lon <= bounds.east:
-                    waypoints.append({
-                        'latitude': lat,
-                        'longitude': lon,
-                        'altitude': altitude,
-                        'sequence': len(waypoints)
-                    })
-                    lon += lon_spacing
-            else:  # Right to left
-                lon = bounds.east
-                while lon >= bounds.west:
-                    waypoints.append({
-                        'latitude': lat,
-                        'longitude': lon,
-                        'altitude': altitude,
-                        'sequence': len(waypoints)
-                    })
-                    lon -= lon_spacing
+        return PathUtils.generate_grid_buffer(bounds, spacing, altitude).to_dicts()
+    
+    @staticmethod
+    def generate_grid_buffer(bounds: BoundingBox, spacing: float,
+                             altitude: float = 10.0, dtype=np.float64) -> WaypointBuffer:
+        """
+        Generate grid pattern waypoints within bounding box as a WaypointBuffer
+        
+        Args:
+            bounds: Bounding box for grid
+            spacing: Grid spacing in meters
+            altitude: Flight altitude
+            dtype: Storage type for the buffer (np.float32 for large grids,
+                ~0.5 m coordinate resolution)
             
-            lat += lat_spacing
-            row += 1
+        Returns:
+            WaypointBuffer in flight order
+        """
+        # Convert spacing from meters to degrees at the grid's center latitude
+        center_lat = (bounds.north + bounds.south) / 2
+        lat_spacing, lon_spacing = meters_to_degrees(center_lat, spacing, spacing)
+        
+        # Number of rows and columns that fit inside the bounds
+        num_rows = max(0, math.floor((bounds.north - bounds.south) / lat_spacing + 1e-9) + 1)
+        num_cols = max(0, math.floor((bounds.east - bounds.west) / lon_spacing + 1e-9) + 1)
+        if num_rows == 0 or num_cols == 0:
+            return WaypointBuffer([], [], altitude, dtype=dtype)
         
-        return waypoints
+        steps = np.arange(num_cols) * lon_spacing
+        lats = bounds.south + np.arange(num_rows) * lat_spacing
+        
+        # Boustrophedon pattern: even rows run west to east, odd rows east to west
+        grid_lon = np.empty((num_rows, num_cols))
+        grid_lon[0::2] = bounds.west + steps
+        grid_lon[1::2] = bounds.east - steps
+        
+        return WaypointBuffer(np.repeat(lats, num_cols), grid_lon.ravel(), altitude, dtype=dtype)
     
     @staticmethod
     def generate_circle_waypoints(center_lat: float, center_lon: float, 
@@ -552,24 +876,45 @@ class PathUtils:
         Returns:
             List of waypoint dictionaries
         """
-        waypoints = []
-        angle_step = 360.0 / num_points
+        return PathUtils.generate_circle_buffer(
+            center_lat, center_lon, radius, num_points, altitude, clockwise
+        ).to_dicts()
+    
+    @staticmethod
+    def generate_circle_buffer(center_lat: float, center_lon: float,
+                               radius: float, num_points: int = 8,
+                               altitude: float = 10.0, clockwise: bool = True) -> WaypointBuffer:
+        """
+        Generate circular pattern waypoints as a WaypointBuffer
         
-        for i in range(num_points):
-            angle = i * angle_step
-            if not clockwise:
-                angle = 360 - angle
-            
-            lat, lon = DistanceCalculator.destination_point(center_lat, center_lon, angle, radius)
+        Args:
+            center_lat, center_lon: Circle center
+            radius: Circle radius in meters
+            num_points: Number of waypoints
+            altitude: Flight altitude
+            clockwise: Direction of flight
             
-            waypoints.append({
-                'latitude': lat,
-                'longitude': lon,
-                'altitude': altitude,
-                'sequence': i
-            })
+        Returns:
+            WaypointBuffer in flight order
+        """
+        angle_step = 360.0 / num_points
+        
+        angles = np.arange(num_points) * angle_step
+        if not clockwise:
+            angles = 360 - angles
         
-        return waypoints
+        lats, lons = DistanceCalculator.destination_point_batch(center_lat, center_lon, angles, radius)
+        
+        return WaypointBuffer(lats, lons, altitude)
+
+# Fix quality scoring tables: satellites >= threshold, hdop <= threshold
+_SAT_THRESHOLDS = (4, 6, 8)
+_SAT_SCORES = (10, 20, 30, 40)
+_HDOP_THRESHOLDS = (1.0, 2.0, 5.0)
+_HDOP_SCORES = (30, 25, 15, 5)
+_FIX_TYPE_SCORES = (0, 0, 15, 30)  # no fix, no fix, 2D, 3D
+_QUALITY_THRESHOLDS = (50, 70, 85)
+_QUALITY_LEVELS = ("poor", "fair", "good", "excellent")
 
 
 class GPSQualityAssessment:
@@ -582,52 +927,15 @@ class GPSQualityAssessment:
         
         Args:
             satellites: Number of satellites
-            hdop: Horizontal dilution of precision
+            hdop: Horizontal dilution of precision (scored at 0.1 resolution, gated exactly)
             fix_type: GPS fix type
             
         Returns:
             Quality assessment dictionary
         """
-        # Base score
-        score = 0
-        
-        # Satellite count scoring
-        if satellites >= 8:
-            score += 40
-        elif satellites >= 6:
-            score += 30
-        elif satellites >= 4:
-            score += 20
-        else:
-            score += 10
-        
-        # HDOP scoring
-        if hdop <= 1.0:
-            score += 30
-        elif hdop <= 2.0:
-            score += 25
-        elif hdop <= 5.0:
-            score += 15
-        else:
-            score += 5
-        
-        # Fix type scoring
-        if fix_type >= 3:  # 3D fix
-            score += 30
-        elif fix_type == 2:  # 2D fix
-            score += 15
-        else:
-            score += 0
-        
-        # Determine quality level
-        if score >= 85:
-            quality = "excellent"
-        elif score >= 70:
-            quality = "good"
-        elif score >= 50:
-            quality = "fair"
-        else:
-            quality = "poor"
+        # Receivers keep reporting the same few values, so the score is cached
+        # at 0.1 hdop resolution; the navigation gate uses the exact hdop
+        score, quality = GPSQualityAssessment._score_fix(satellites, round(hdop, 1), fix_type)
         
         # Navigation suitability
         navigation_ready = (fix_type >= 3 and satellites >= 6 and hdop <= 2.0)
@@ -642,6 +950,20 @@ class GPSQualityAssessment:
             "recommendations": GPSQualityAssessment._get_recommendations(satellites, hdop, fix_type)
         }
     
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _score_fix(satellites: int, hdop: float, fix_type: int) -> Tuple[int, str]:
+        """Compute the fix quality score and level (cached)"""
+        # Score each input by its threshold bucket
+        score = (_SAT_SCORES[bisect_right(_SAT_THRESHOLDS, satellites)] +
+                 _HDOP_SCORES[bisect_left(_HDOP_THRESHOLDS, hdop)] +
+                 _FIX_TYPE_SCORES[min(max(fix_type, 0), 3)])
+        
+        # Determine quality level
+        quality = _QUALITY_LEVELS[bisect_right(_QUALITY_THRESHOLDS, score)]
+        
+        return score, quality
+    
     @staticmethod
     def _get_recommendations(satellites: int, hdop: float, fix_type: int) -> List[str]:
         """Get recommendations for improving GPS quality"""
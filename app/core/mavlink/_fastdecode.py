@@ -0,0 +1,143 @@
+"""
+Specialized MAVLink frame decoding for the high-rate telemetry messages
+"""
+
+import os
+import sys
+from typing import Dict, Tuple
+
+from pymavlink.dialects.v20 import common as mavlink
+
+# Optional compiled X.25 CRC (see _crc.c for build instructions)
+try:
+    from cffi import FFI
+    
+    _ffi = FFI()
+    _ffi.cdef("uint16_t crc_x25(const uint8_t *buf, size_t n, uint16_t crc);")
+    _crc_lib = _ffi.dlopen(os.path.join(os.path.dirname(os.path.abspath(__file__)), '_crc.so'))
+except (ImportError, OSError):
+    _crc_lib = None
+
+_PROTOCOL_MARKER_V1 = 0xFE
+_PROTOCOL_MARKER_V2 = 0xFD
+_IFLAG_SIGNED = 0x01
+
+# Messages decoded on every frame by MAVLinkManager; everything else goes
+# through pymavlink's generic decoder
+_FAST_MSG_IDS = (
+    mavlink.MAVLINK_MSG_ID_HEARTBEAT,
+    mavlink.MAVLINK_MSG_ID_GLOBAL_POSITION_INT,
+    mavlink.MAVLINK_MSG_ID_ATTITUDE,
+)
+
+
+def _install_crc(dialect) -> None:
+    """Back pymavlink's x25crc (used when packing and by the fallback decoder) with _crc.so"""
+    x25crc = dialect.x25crc
+    if _crc_lib is None or getattr(x25crc, '_compiled', False):
+        return
+    accumulate = x25crc.accumulate
+    
+    def compiled_accumulate(self, buf):
+        try:
+            data = _ffi.from_buffer("uint8_t[]", buf)
+        except TypeError:
+            # Not a byte buffer (e.g. a list of ints)
+            accumulate(self, buf)
+            return
+        self.crc = _crc_lib.crc_x25(data, len(data), self.crc)
+    
+    x25crc.accumulate = compiled_accumulate
+    x25crc._compiled = True
+
+
+class FastDecoder:
+    """Drop-in replacement for ``MAVLink.decode`` with fixed-layout fast paths
+
+    pymavlink's decoder is generic: it re-derives the field order, array and
+    string handling for every frame. For the message types above the layout is
+    known up front, so the payload is unpacked with the precompiled struct and
+    reordered through a fixed index tuple. Signed frames, unknown layouts and
+    malformed frames are handed to the original decoder, which also produces
+    the usual MAVError messages.
+    """
+
+    def __init__(self, mav):
+        dialect = sys.modules[type(mav).__module__]
+        self._mav = mav
+        self._fallback = mav.decode
+        self._header_cls = dialect.MAVLink_header
+        self._x25crc = dialect.x25crc
+        self._ignore_crc = dialect.MAVLINK_IGNORE_CRC
+
+        # msg_id -> (message class, payload unpacker, CRC extra, wire->field order)
+        self._layouts: Dict[int, Tuple] = {}
+        for msg_id in _FAST_MSG_IDS:
+            msgtype = dialect.mavlink_map.get(msg_id)
+            if msgtype is None or sum(msgtype.lengths) != len(msgtype.lengths) or 'char' in msgtype.fieldtypes:
+                continue
+            self._layouts[msg_id] = (msgtype, msgtype.unpacker, msgtype.crc_extra, tuple(msgtype.orders))
+
+    def __call__(self, msgbuf):
+        magic = msgbuf[0]
+        if magic == _PROTOCOL_MARKER_V2:
+            incompat_flags = msgbuf[2]
+            if incompat_flags & _IFLAG_SIGNED:
+                return self._fallback(msgbuf)
+            headerlen = 10
+            compat_flags = msgbuf[3]
+            seq, src_system, src_component = msgbuf[4], msgbuf[5], msgbuf[6]
+            msg_id = msgbuf[7] | (msgbuf[8] << 8) | (msgbuf[9] << 16)
+        elif magic == _PROTOCOL_MARKER_V1:
+            headerlen = 6
+            incompat_flags = compat_flags = 0
+            seq, src_system, src_component = msgbuf[2], msgbuf[3], msgbuf[4]
+            msg_id = msgbuf[5]
+        else:
+            return self._fallback(msgbuf)
+
+        layout = self._layouts.get(msg_id)
+        mlen = msgbuf[1]
+        if layout is None or self._mav.signing.secret_key is not None or mlen != len(msgbuf) - headerlen - 2:
+            return self._fallback(msgbuf)
+        msgtype, unpacker, crc_extra, orders = layout
+
+        crc = msgbuf[-2] | (msgbuf[-1] << 8)
+        if crc != self._frame_crc(msgbuf, crc_extra) and not self._ignore_crc:
+            return self._fallback(msgbuf)
+
+        # MAVLink 2 trims trailing zero bytes from the payload
+        payload = bytes(msgbuf[headerlen:-2])
+        if mlen < unpacker.size:
+            payload += bytes(unpacker.size - mlen)
+        fields = unpacker.unpack_from(payload)
+
+        m = msgtype(*[fields[i] for i in orders])
+        m._signed = False
+        m._msgbuf = msgbuf
+        m._payload = msgbuf[6:-2]
+        m._crc = crc
+        m._header = self._header_cls(msg_id, incompat_flags, compat_flags, mlen, seq, src_system, src_component)
+        return m
+    
+    def _frame_crc(self, msgbuf, crc_extra: int) -> int:
+        """X.25 CRC over the header (after the marker) and payload, then the CRC extra byte"""
+        if _crc_lib is None:
+            crcbuf = msgbuf[1:-2]
+            crcbuf.append(crc_extra)
+            return self._x25crc(crcbuf).crc
+        
+        frame = _ffi.from_buffer("uint8_t[]", msgbuf)
+        crc = _crc_lib.crc_x25(frame + 1, len(frame) - 3, 0xFFFF)
+        
+        # Fold in the single extra byte here rather than with a second FFI call
+        tmp = crc_extra ^ (crc & 0xFF)
+        tmp = (tmp ^ (tmp << 4)) & 0xFF
+        return (crc >> 8) ^ (tmp << 8) ^ (tmp << 3) ^ (tmp >> 4)
+
+
+def install(mav) -> None:
+    """Route frames parsed by a pymavlink ``MAVLink`` instance through FastDecoder"""
+    _install_crc(sys.modules[type(mav).__module__])
+    if not isinstance(mav.decode, FastDecoder):
+        mav.decode = FastDecoder(mav)
@@ -4,16 +4,75 @@ MAVLink command wrappers and high-level command interface
 
 import asyncio
 import logging
+import sys
 import time
-from typing import Dict, Any, Optional, Tuple, List
+from collections import deque
+from functools import lru_cache
+from itertools import islice
+from types import MappingProxyType
+from typing import Deque, Dict, Any, Mapping, NamedTuple, Optional, Tuple, List
 from enum import Enum
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 
+import numpy as np
+
+from app.core.gps.utils import DistanceCalculator
 from app.utils.constants import MAVLinkCommands, FlightModes
 from app.utils.exceptions import MAVLinkConnectionException, SafetyViolationException
 
 logger = logging.getLogger(__name__)
 
+# dataclass slots are only available from Python 3.10
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Also attach the raw parameters to successful command responses (debugging aid);
+# failed, timed-out and errored commands always carry them
+_DEBUG_CAPTURE_PARAMS = False
+
+# Flight mode names (upper-case) to ArduPilot custom mode ids
+_MODE_MAPPING: Mapping[str, int] = MappingProxyType({
+    'MANUAL': FlightModes.STABILIZE,
+    'STABILIZE': FlightModes.STABILIZE,
+    'GUIDED': FlightModes.GUIDED,
+    'AUTO': FlightModes.AUTO,
+    'RTL': FlightModes.RTL,
+    'LOITER': FlightModes.LOITER,
+    'LAND': FlightModes.LAND
+})
+
+# Parameter tuple for commands that take no arguments
+_NO_PARAMS = (0, 0, 0, 0, 0, 0, 0)
+
+# Fully specialized parameters for the fixed mission and safety commands
+_AUTO_PARAMS = (1.0, float(FlightModes.AUTO), 0.0, 0.0, 0.0, 0.0, 0.0)
+_LOITER_PARAMS = (1.0, float(FlightModes.LOITER), 0.0, 0.0, 0.0, 0.0, 0.0)
+_LAND_PARAMS = (1.0, float(FlightModes.LAND), 0.0, 0.0, 0.0, 0.0, 0.0)
+_FORCE_DISARM_PARAMS = (0.0, 21196.0, 0.0, 0.0, 0.0, 0.0, 0.0)
+
+# Safety commands are never rejected as stale: land, RTL, and the emergency
+# stop / emergency land parameter sets
+_SAFETY_COMMANDS = frozenset({MAVLinkCommands.NAV_LAND, MAVLinkCommands.NAV_RETURN_TO_LAUNCH})
+_SAFETY_PARAMS = frozenset({_FORCE_DISARM_PARAMS, _LAND_PARAMS})
+
+# Square pattern corner bearings: North, East, South, West
+_SQUARE_BEARINGS = np.array([0.0, 90.0, 180.0, 270.0])
+
+# Default ACK timeout and per-command overrides (seconds) for each link profile
+_LINK_PROFILES: Dict[str, Tuple[float, Dict[int, float]]] = {
+    'normal': (1.2, {
+        MAVLinkCommands.NAV_TAKEOFF: 10.0,
+        MAVLinkCommands.NAV_LAND: 10.0,
+        MAVLinkCommands.COMPONENT_ARM_DISARM: 3.0,
+        MAVLinkCommands.DO_SET_MODE: 2.0
+    }),
+    'satellite': (10.0, {
+        MAVLinkCommands.NAV_TAKEOFF: 30.0,
+        MAVLinkCommands.NAV_LAND: 30.0,
+        MAVLinkCommands.COMPONENT_ARM_DISARM: 15.0,
+        MAVLinkCommands.DO_SET_MODE: 15.0
+    })
+}
+
 
 class CommandResult(Enum):
     """Command execution results"""
@@ -24,7 +83,7 @@ class CommandResult(Enum):
     IN_PROGRESS = "in_progress"
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class CommandResponse:
     """Command response data structure"""
     command_id: int
@@ -34,28 +93,119 @@ class CommandResponse:
     data: Optional[Dict[str, Any]] = None
 
 
+# Preconstructed responses for the early-exit validation failures. Parameterized
+# messages are filled in with dataclasses.replace on the matching template.
+_ERR_NO_WAYPOINTS = CommandResponse(
+    command_id=0,
+    result=CommandResult.FAILED,
+    message="No waypoints provided",
+    execution_time=0.0
+)
+_ERR_NO_GPS = CommandResponse(
+    command_id=MAVLinkCommands.COMPONENT_ARM_DISARM,
+    result=CommandResult.FAILED,
+    message="No GPS data available",
+    execution_time=0.0
+)
+_ERR_TAKEOFF_NOT_POSITIVE = CommandResponse(
+    command_id=MAVLinkCommands.NAV_TAKEOFF,
+    result=CommandResult.FAILED,
+    message="Takeoff altitude must be positive",
+    execution_time=0.0
+)
+_ERR_ARM = CommandResponse(
+    command_id=MAVLinkCommands.COMPONENT_ARM_DISARM,
+    result=CommandResult.FAILED,
+    message="",
+    execution_time=0.0
+)
+_ERR_TAKEOFF = CommandResponse(
+    command_id=MAVLinkCommands.NAV_TAKEOFF,
+    result=CommandResult.FAILED,
+    message="",
+    execution_time=0.0
+)
+_ERR_SET_MODE = CommandResponse(
+    command_id=MAVLinkCommands.DO_SET_MODE,
+    result=CommandResult.FAILED,
+    message="",
+    execution_time=0.0
+)
+_ERR_GPS_FIX_FMT = "GPS fix insufficient (type={})"
+_ERR_GPS_SATS_FMT = "Insufficient satellites ({}<{})"
+_ERR_MAX_ALTITUDE_FMT = "Altitude {}m exceeds maximum {}m"
+
+
+class PendingWork(NamedTuple):
+    """A command awaiting completion"""
+    command_id: int
+    future: asyncio.Future
+    deadline_ns: int  # time.monotonic_ns() deadline
+    params: Tuple[float, ...]
+
+
+# Dense index for the known command IDs, used to address the pending-command table
+_CMD_INDEX: Dict[int, int] = {
+    command: index
+    for index, command in enumerate(sorted({
+        value for name, value in vars(MAVLinkCommands).items()
+        if not name.startswith('_') and isinstance(value, int)
+    }))
+}
+
+
+@lru_cache(maxsize=128)
+def _square_corners(center_lat: float, center_lon: float,
+                    side_length: float) -> Tuple[Tuple[float, float], ...]:
+    """Corner coordinates of a square pattern, computed in one vectorized call"""
+    lats, lons = DistanceCalculator.destination_point_batch(
+        center_lat, center_lon, _SQUARE_BEARINGS, side_length / 2
+    )
+    return tuple(zip(lats.tolist(), lons.tolist()))
+
+
+@lru_cache(maxsize=None)
+def _success_message(command: int) -> str:
+    """Success message for a command ID, built once per ID"""
+    return f"Command {command} executed successfully"
+
+
 class MAVLinkCommandInterface:
     """High-level MAVLink command interface"""
     
-    def __init__(self, mavlink_connection):
+    def __init__(self, mavlink_connection, history_capacity: int = 1024):
         self.connection = mavlink_connection
-        self.command_timeout = 30.0
+        self.command_timeout, self._timeouts = _LINK_PROFILES['normal']
         self.retry_attempts = 3
         self.command_sequence = 0
         
         # Command tracking
-        self.pending_commands: Dict[int, Dict[str, Any]] = {}
-        self.command_history: List[CommandResponse] = []
+        # Pending commands per command ID: a slot per known ID, overflow dict for the rest
+        self._pending: List[List[PendingWork]] = [[] for _ in range(len(_CMD_INDEX))]
+        self._pending_overflow: Dict[int, List[PendingWork]] = {}
+        self._pending_count = 0
+        self._in_flight: set = set()
+        
+        # Submission queue: commands enqueued within batch_window go out in one write
+        self.batch_window = 0.0005
+        self._sq: Optional[asyncio.Queue] = None
+        self._submitter_task: Optional[asyncio.Task] = None
+        self._last_ts: Dict[int, int] = {}
+        self.history_capacity = history_capacity
+        self.command_history: Deque[CommandResponse] = deque(maxlen=history_capacity)
         
         # Statistics
         self.commands_sent = 0
         self.commands_successful = 0
         self.commands_failed = 0
+        self._success_rate = 0.0
+        self._stats: Dict[str, Any] = {}
     
     async def send_command_long(self, command: int, param1: float = 0, param2: float = 0,
                                param3: float = 0, param4: float = 0, param5: float = 0,
                                param6: float = 0, param7: float = 0,
-                               timeout: float = None) -> CommandResponse:
+                               timeout: float = None,
+                               issued_at_us: Optional[int] = None) -> CommandResponse:
         """
         Send MAVLink COMMAND_LONG message with response tracking
         
@@ -63,60 +213,210 @@ class MAVLinkCommandInterface:
             command: MAVLink command ID
             param1-param7: Command parameters
             timeout: Command timeout in seconds
+            issued_at_us: Time the command was issued (UNIX microseconds), if known.
+                A stamped command older than the last stamped one with the same ID
+                is rejected (safety commands excepted); unstamped commands are not checked.
+            
+        Returns:
+            CommandResponse with execution result
+        """
+        return await self._send_positional(
+            command,
+            (param1, param2, param3, param4, param5, param6, param7),
+            timeout,
+            issued_at_us
+        )
+    
+    async def _send_positional(self, command: int, params: Tuple[float, ...],
+                               timeout: Optional[float] = None,
+                               issued_at_us: Optional[int] = None,
+                               allow_duplicate: bool = False) -> CommandResponse:
+        """
+        Send COMMAND_LONG with the seven parameters already packed
+        
+        Args:
+            command: MAVLink command ID
+            params: Tuple of param1-param7
+            timeout: Command timeout in seconds
+            issued_at_us: Time the command was issued (UNIX microseconds)
+            allow_duplicate: Send even if an identical command is in flight
             
         Returns:
             CommandResponse with execution result
         """
-        start_time = time.time()
-        timeout = timeout or self.command_timeout
-        self.command_sequence += 1
+        start_ns = time.monotonic_ns()
+        timeout = timeout or self._timeouts.get(command, self.command_timeout)
+        
+        # Drop commands overtaken by a newer one with the same ID. Only caller
+        # stamps are compared: a local wall-clock stamp would reject everything
+        # after the clock steps back (e.g. an NTP sync on the Pi)
+        if issued_at_us is not None:
+            if (issued_at_us < self._last_ts.get(command, 0)
+                    and command not in _SAFETY_COMMANDS and params not in _SAFETY_PARAMS):
+                return CommandResponse(
+                    command_id=command,
+                    result=CommandResult.REJECTED,
+                    message=f"Command {command} is stale",
+                    execution_time=0.0
+                )
+        
+        # Identical commands in flight would make the ACK ambiguous. Callers that
+        # expect repeats (e.g. a mission revisiting a waypoint) and safety
+        # commands, which must always go out, get a per-call key
+        if allow_duplicate or command in _SAFETY_COMMANDS or params in _SAFETY_PARAMS:
+            key = object()
+        else:
+            key = (command, params)
+        if key in self._in_flight:
+            return CommandResponse(
+                command_id=command,
+                result=CommandResult.REJECTED,
+                message=f"Command {command} already in flight",
+                execution_time=0.0
+            )
+        
+        self._in_flight.add(key)
+        if issued_at_us is not None:
+            self._last_ts[command] = max(issued_at_us, self._last_ts.get(command, 0))
+        work = None
+        data = None
         
         try:
             # Send command
-            success = await self.connection.send_command_long(
-                command, param1, param2, param3, param4, param5, param6, param7
-            )
+            future = self._submit(command, params)
+            work = PendingWork(command, future, start_ns + int(timeout * 1e9), params)
+            pending = self._pending_slot(command)
+            pending.append(work)
+            self._pending_count += 1
             
+            success = await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            self.commands_failed += 1
+            result = CommandResult.TIMEOUT
+            message = f"Command {command} timed out after {timeout}s"
+            data = {"parameters": params}
+        except Exception as e:
+            self.commands_failed += 1
+            result = CommandResult.FAILED
+            message = f"Command {command} error: {str(e)}"
+            data = {"parameters": params}
+        else:
             self.commands_sent += 1
-            
             if success:
                 self.commands_successful += 1
-                execution_time = time.time() - start_time
-                
-                response = CommandResponse(
-                    command_id=command,
-                    result=CommandResult.SUCCESS,
-                    message=f"Command {command} executed successfully",
-                    execution_time=execution_time,
-                    data={"parameters": [param1, param2, param3, param4, param5, param6, param7]}
-                )
+                self.command_sequence += 1
+                result = CommandResult.SUCCESS
+                message = _success_message(command)
+                if _DEBUG_CAPTURE_PARAMS:
+                    data = {"parameters": params}
             else:
                 self.commands_failed += 1
-                execution_time = time.time() - start_time
-                
-                response = CommandResponse(
-                    command_id=command,
-                    result=CommandResult.FAILED,
-                    message=f"Command {command} failed to send",
-                    execution_time=execution_time
-                )
+                result = CommandResult.FAILED
+                message = f"Command {command} failed to send"
+                data = {"parameters": params}
+            self._success_rate = self.commands_successful * 100.0 / self.commands_sent
+        finally:
+            execution_time = (time.monotonic_ns() - start_ns) * 1e-9
+            self._in_flight.discard(key)
+            if work is not None:
+                pending.remove(work)
+                self._pending_count -= 1
+        
+        return self._build_response(command, result, message, execution_time, data)
+    
+    def _pending_slot(self, command: int) -> List[PendingWork]:
+        """Pending-work list for a command ID"""
+        index = _CMD_INDEX.get(command)
+        if index is not None:
+            return self._pending[index]
+        return self._pending_overflow.setdefault(command, [])
+    
+    def is_pending(self, command: int) -> bool:
+        """Check whether a command with this ID is awaiting completion"""
+        index = _CMD_INDEX.get(command)
+        if index is not None:
+            return bool(self._pending[index])
+        return bool(self._pending_overflow.get(command))
+    
+    def _submit(self, command: int, params: Tuple[float, ...]) -> asyncio.Future:
+        """Queue a command for the submitter task and return its completion future"""
+        if self._submitter_task is None or self._submitter_task.done():
+            self._sq = asyncio.Queue()
+            self._submitter_task = asyncio.ensure_future(self._submitter())
+        
+        future = asyncio.get_event_loop().create_future()
+        self._sq.put_nowait((command, params, future))
+        return future
+    
+    async def _submitter(self):
+        """Drain the submission queue and send each batch in a single write"""
+        while True:
+            batch = [await self._sq.get()]
             
-            self.command_history.append(response)
-            return response
+            # Coalescing window, then take everything that is ready
+            if self.batch_window > 0:
+                await asyncio.sleep(self.batch_window)
+            while True:
+                try:
+                    batch.append(self._sq.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
             
-        except Exception as e:
-            self.commands_failed += 1
-            execution_time = time.time() - start_time
+            # Skip commands whose caller already timed out
+            batch = [item for item in batch if not item[2].done()]
+            if not batch:
+                continue
             
-            response = CommandResponse(
-                command_id=command,
-                result=CommandResult.FAILED,
-                message=f"Command {command} error: {str(e)}",
-                execution_time=execution_time
-            )
+            try:
+                results = await self._send_batch(batch)
+            except Exception as e:
+                for _, _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
             
-            self.command_history.append(response)
-            return response
+            for (_, _, future), success in zip(batch, results):
+                if not future.done():
+                    future.set_result(success)
+    
+    async def _send_batch(self, batch: List[Tuple[int, Tuple[float, ...], asyncio.Future]]) -> List[bool]:
+        """Send a batch through the connection, one command at a time if it cannot batch
+        
+        Returns one send result per batch entry.
+        """
+        send_batch = getattr(self.connection, 'send_command_long_batch', None)
+        if send_batch is not None:
+            # A single write: every command in it went out or none did
+            success = await send_batch([(command, params) for command, params, _ in batch])
+            return [success] * len(batch)
+        
+        return await asyncio.gather(*[
+            self.connection.send_command_long(command, *params)
+            for command, params, _ in batch
+        ])
+    
+    async def close(self):
+        """Stop the submitter task"""
+        if self._submitter_task and not self._submitter_task.done():
+            self._submitter_task.cancel()
+            try:
+                await self._submitter_task
+            except asyncio.CancelledError:
+                pass
+        self._submitter_task = None
+    
+    def _build_response(self, command: int, result: CommandResult, message: str,
+                        execution_time: float, data: Optional[Dict[str, Any]] = None) -> CommandResponse:
+        """Build a command response and record it in the history"""
+        response = CommandResponse(
+            command_id=command,
+            result=result,
+            message=message,
+            execution_time=execution_time,
+            data=data
+        )
+        self.command_history.append(response)
+        return response
     
     async def arm_disarm(self, arm: bool, force: bool = False) -> CommandResponse:
         """
@@ -132,9 +432,9 @@ class MAVLinkCommandInterface:
         param1 = 1.0 if arm else 0.0
         param2 = 21196.0 if force else 0.0  # Force parameter
         
-        return await self.send_command_long(
+        return await self._send_positional(
             MAVLinkCommands.COMPONENT_ARM_DISARM,
-            param1, param2
+            (param1, param2, 0, 0, 0, 0, 0)
         )
     
     async def set_mode(self, mode: str) -> CommandResponse:
@@ -147,30 +447,13 @@ class MAVLinkCommandInterface:
         Returns:
             CommandResponse with result
         """
-        mode_mapping = {
-            'MANUAL': FlightModes.STABILIZE,
-            'STABILIZE': FlightModes.STABILIZE,
-            'GUIDED': FlightModes.GUIDED,
-            'AUTO': FlightModes.AUTO,
-            'RTL': FlightModes.RTL,
-            'LOITER': FlightModes.LOITER,
-            'LAND': FlightModes.LAND
-        }
-        
-        if mode.upper() not in mode_mapping:
-            return CommandResponse(
-                command_id=MAVLinkCommands.DO_SET_MODE,
-                result=CommandResult.FAILED,
-                message=f"Unknown flight mode: {mode}",
-                execution_time=0.0
-            )
+        mode_id = _MODE_MAPPING.get(mode.upper())
+        if mode_id is None:
+            return replace(_ERR_SET_MODE, message=f"Unknown flight mode: {mode}")
         
-        mode_id = mode_mapping[mode.upper()]
-        
-        return await self.send_command_long(
+        return await self._send_positional(
             MAVLinkCommands.DO_SET_MODE,
-            1,  # MAV_MODE_FLAG_CUSTOM_MODE_ENABLED
-            mode_id
+            (1, mode_id, 0, 0, 0, 0, 0)  # MAV_MODE_FLAG_CUSTOM_MODE_ENABLED
         )
     
     async def takeoff(self, altitude: float, latitude: float = 0, longitude: float = 0) -> CommandResponse:
@@ -185,15 +468,17 @@ class MAVLinkCommandInterface:
         Returns:
             CommandResponse with result
         """
-        return await self.send_command_long(
+        return await self._send_positional(
             MAVLinkCommands.NAV_TAKEOFF,
-            0,  # Minimum pitch
-            0,  # Empty
-            0,  # Empty
-            0,  # Yaw angle
-            latitude,
-            longitude,
-            altitude
+            (
+                0,  # Minimum pitch
+                0,  # Empty
+                0,  # Empty
+                0,  # Yaw angle
+                latitude,
+                longitude,
+                altitude
+            )
         )
     
     async def land(self, latitude: float = 0, longitude: float = 0, altitude: float = 0) -> CommandResponse:
@@ -208,15 +493,17 @@ class MAVLinkCommandInterface:
         Returns:
             CommandResponse with result
         """
-        return await self.send_command_long(
+        return await self._send_positional(
             MAVLinkCommands.NAV_LAND,
-            0,  # Abort altitude
-            0,  # Precision land mode
-            0,  # Empty
-            0,  # Desired yaw angle
-            latitude,
-            longitude,
-            altitude
+            (
+                0,  # Abort altitude
+                0,  # Precision land mode
+                0,  # Empty
+                0,  # Desired yaw angle
+                latitude,
+                longitude,
+                altitude
+            )
         )
     
     async def return_to_launch(self) -> CommandResponse:
@@ -226,10 +513,11 @@ class MAVLinkCommandInterface:
         Returns:
             CommandResponse with result
         """
-        return await self.send_command_long(MAVLinkCommands.NAV_RETURN_TO_LAUNCH)
+        return await self._send_positional(MAVLinkCommands.NAV_RETURN_TO_LAUNCH, _NO_PARAMS)
     
     async def goto_position(self, latitude: float, longitude: float, altitude: float,
-                           hold_time: float = 0, acceptance_radius: float = 2.0) -> CommandResponse:
+                           hold_time: float = 0, acceptance_radius: float = 2.0,
+                           allow_duplicate: bool = False) -> CommandResponse:
         """
         Command vehicle to go to specific position
         
@@ -239,19 +527,23 @@ class MAVLinkCommandInterface:
             altitude: Target altitude
             hold_time: Hold time at waypoint in seconds
             acceptance_radius: Acceptance radius in meters
+            allow_duplicate: Send even if an identical goto is in flight
             
         Returns:
             CommandResponse with result
         """
-        return await self.send_command_long(
+        return await self._send_positional(
             MAVLinkCommands.NAV_WAYPOINT,
-            hold_time,
-            acceptance_radius,
-            0,  # Pass through
-            0,  # Desired yaw
-            latitude,
-            longitude,
-            altitude
+            (
+                hold_time,
+                acceptance_radius,
+                0,  # Pass through
+                0,  # Desired yaw
+                latitude,
+                longitude,
+                altitude
+            ),
+            allow_duplicate=allow_duplicate
         )
     
     async def change_speed(self, speed: float, speed_type: int = 0) -> CommandResponse:
@@ -265,12 +557,9 @@ class MAVLinkCommandInterface:
         Returns:
             CommandResponse with result
         """
-        return await self.send_command_long(
+        return await self._send_positional(
             MAVLinkCommands.DO_CHANGE_SPEED,
-            speed_type,
-            speed,
-            -1,  # Throttle (-1 = no change)
-            0, 0, 0, 0
+            (speed_type, speed, -1, 0, 0, 0, 0)  # Throttle -1 = no change
         )
     
     async def set_home_position(self, latitude: float = 0, longitude: float = 0,
@@ -286,13 +575,15 @@ class MAVLinkCommandInterface:
         Returns:
             CommandResponse with result
         """
-        return await self.send_command_long(
+        return await self._send_positional(
             MAVLinkCommands.DO_SET_HOME,
-            1,  # Use current position
-            0, 0, 0,
-            latitude,
-            longitude,
-            altitude
+            (
+                1,  # Use current position
+                0, 0, 0,
+                latitude,
+                longitude,
+                altitude
+            )
         )
     
     async def set_servo(self, servo_number: int, pwm_value: int) -> CommandResponse:
@@ -306,11 +597,9 @@ class MAVLinkCommandInterface:
         Returns:
             CommandResponse with result
         """
-        return await self.send_command_long(
+        return await self._send_positional(
             MAVLinkCommands.DO_SET_SERVO,
-            servo_number,
-            pwm_value,
-            0, 0, 0, 0, 0
+            (servo_number, pwm_value, 0, 0, 0, 0, 0)
         )
     
     async def set_relay(self, relay_number: int, state: bool) -> CommandResponse:
@@ -324,11 +613,9 @@ class MAVLinkCommandInterface:
         Returns:
             CommandResponse with result
         """
-        return await self.send_command_long(
+        return await self._send_positional(
             MAVLinkCommands.DO_SET_RELAY,
-            relay_number,
-            1 if state else 0,
-            0, 0, 0, 0, 0
+            (relay_number, 1 if state else 0, 0, 0, 0, 0, 0)
         )
     
     async def mission_start(self) -> CommandResponse:
@@ -338,7 +625,7 @@ class MAVLinkCommandInterface:
         Returns:
             CommandResponse with result
         """
-        return await self.set_mode("AUTO")
+        return await self._send_positional(MAVLinkCommands.DO_SET_MODE, _AUTO_PARAMS)
     
     async def mission_pause(self) -> CommandResponse:
         """
@@ -347,7 +634,7 @@ class MAVLinkCommandInterface:
         Returns:
             CommandResponse with result
         """
-        return await self.set_mode("LOITER")
+        return await self._send_positional(MAVLinkCommands.DO_SET_MODE, _LOITER_PARAMS)
     
     async def emergency_stop(self) -> CommandResponse:
         """
@@ -356,27 +643,51 @@ class MAVLinkCommandInterface:
         Returns:
             CommandResponse with result
         """
-        return await self.arm_disarm(False, force=True)
+        return await self._send_positional(MAVLinkCommands.COMPONENT_ARM_DISARM, _FORCE_DISARM_PARAMS)
+    
+    async def set_land_mode(self) -> CommandResponse:
+        """
+        Switch to LAND mode with the pre-packed emergency parameters
+        
+        Returns:
+            CommandResponse with result
+        """
+        return await self._send_positional(MAVLinkCommands.DO_SET_MODE, _LAND_PARAMS)
+    
+    def set_link_profile(self, profile: str):
+        """
+        Select ACK timeouts for the link type
+        
+        Args:
+            profile: 'normal' for USB/UDP/Wi-Fi links, 'satellite' for high-latency links
+        """
+        if profile not in _LINK_PROFILES:
+            raise ValueError(f"Unknown link profile: {profile}")
+        
+        self.command_timeout, self._timeouts = _LINK_PROFILES[profile]
+        logger.info(f"Command link profile set to {profile}")
     
     def get_statistics(self) -> Dict[str, Any]:
-        """Get command interface statistics"""
-        success_rate = 0.0
-        if self.commands_sent > 0:
-            success_rate = (self.commands_successful / self.commands_sent) * 100
-        
-        return {
-            "commands_sent": self.commands_sent,
-            "commands_successful": self.commands_successful,
-            "commands_failed": self.commands_failed,
-            "success_rate": success_rate,
-            "command_sequence": self.command_sequence,
-            "pending_commands": len(self.pending_commands),
-            "history_length": len(self.command_history)
-        }
+        """
+        Get command interface statistics
+        
+        Returns:
+            Statistics dict, reused and updated in place on every call
+        """
+        stats = self._stats
+        stats["commands_sent"] = self.commands_sent
+        stats["commands_successful"] = self.commands_successful
+        stats["commands_failed"] = self.commands_failed
+        stats["success_rate"] = self._success_rate
+        stats["command_sequence"] = self.command_sequence
+        stats["pending_commands"] = self._pending_count
+        stats["history_length"] = len(self.command_history)
+        return stats
     
     def get_command_history(self, limit: int = 50) -> List[CommandResponse]:
         """Get recent command history"""
-        return self.command_history[-limit:]
+        size = len(self.command_history)
+        return list(islice(self.command_history, max(0, size - limit), size))
     
     def clear_history(self):
         """Clear command history"""
@@ -404,40 +715,40 @@ class MissionCommands:
         # In a full implementation, you would use the mission protocol
         
         if not waypoints:
-            return CommandResponse(
-                command_id=0,
-                result=CommandResult.FAILED,
-                message="No waypoints provided",
-                execution_time=0.0
-            )
+            return _ERR_NO_WAYPOINTS
         
-        start_time = time.time()
+        start_ns = time.monotonic_ns()
         
         try:
-            # Switch to GUIDED mode first
+            # Switch to GUIDED mode before any waypoint goes out (simplified)
             mode_result = await self.cmd.set_mode("GUIDED")
             if mode_result.result != CommandResult.SUCCESS:
                 return mode_result
             
-            # Send each waypoint as a goto command (simplified)
-            # In practice, you'd use proper mission upload protocol
-            success_count = 0
+            # Send waypoints; they are queued together, so the submitter batches
+            # them into a single write. In practice, you'd use proper mission
+            # upload protocol
+            results = await asyncio.gather(
+                *[
+                    self.cmd.goto_position(
+                        w['latitude'],
+                        w['longitude'],
+                        w['altitude'],
+                        w.get('hold_time', 0),
+                        w.get('acceptance_radius', 2.0),
+                        allow_duplicate=True
+                    )
+                    for w in waypoints
+                ],
+                return_exceptions=True
+            )
             
-            for i, waypoint in enumerate(waypoints):
-                result = await self.cmd.goto_position(
-                    waypoint['latitude'],
-                    waypoint['longitude'],
-                    waypoint['altitude'],
-                    waypoint.get('hold_time', 0),
-                    waypoint.get('acceptance_radius', 2.0)
-                )
-                
-                if result.result == CommandResult.SUCCESS:
-                    success_count += 1
-                else:
-                    break
+            success_count = sum(
+                1 for r in results
+                if isinstance(r, CommandResponse) and r.result == CommandResult.SUCCESS
+            )
             
-            execution_time = time.time() - start_time
+            execution_time = (time.monotonic_ns() - start_ns) * 1e-9
             
             if success_count == len(waypoints):
                 return CommandResponse(
@@ -457,7 +768,7 @@ class MissionCommands:
                 )
                 
         except Exception as e:
-            execution_time = time.time() - start_time
+            execution_time = (time.monotonic_ns() - start_ns) * 1e-9
             return CommandResponse(
                 command_id=MAVLinkCommands.NAV_WAYPOINT,
                 result=CommandResult.FAILED,
@@ -479,29 +790,18 @@ class MissionCommands:
         Returns:
             CommandResponse with result
         """
-        from app.utils.helpers import calculate_destination_point
-        
-        # Generate square waypoints
-        half_side = side_length / 2
-        waypoints = []
-        
-        # Calculate corner positions
-        corners = [
-            (0, half_side),    # North
-            (90, half_side),   # East
-            (180, half_side),  # South
-            (270, half_side)   # West
-        ]
-        
-        for i, (bearing, distance) in enumerate(corners):
-            lat, lon = calculate_destination_point(center_lat, center_lon, bearing, distance)
-            waypoints.append({
+        # Generate square waypoints (inputs rounded to ~0.1 m so repeats hit the cache)
+        corners = _square_corners(round(center_lat, 6), round(center_lon, 6), round(side_length, 6))
+        waypoints = [
+            {
                 'latitude': lat,
                 'longitude': lon,
                 'altitude': altitude,
                 'hold_time': 0,
                 'acceptance_radius': 2.0
-            })
+            }
+            for lat, lon in corners
+        ]
         
         return await self.upload_waypoint_mission(waypoints)
 
@@ -525,34 +825,22 @@ class SafetyCommands:
         Returns:
             CommandResponse with result
         """
-        if self.safety_checks_enabled:
-            # Perform safety checks
-            if gps_required:
-                # Check GPS status
-                if not self.cmd.connection.latest_gps:
-                    return CommandResponse(
-                        command_id=MAVLinkCommands.COMPONENT_ARM_DISARM,
-                        result=CommandResult.FAILED,
-                        message="No GPS data available",
-                        execution_time=0.0
-                    )
-                
-                gps = self.cmd.connection.latest_gps
-                if gps.fix_type < 3:
-                    return CommandResponse(
-                        command_id=MAVLinkCommands.COMPONENT_ARM_DISARM,
-                        result=CommandResult.FAILED,
-                        message=f"GPS fix insufficient (type={gps.fix_type})",
-                        execution_time=0.0
-                    )
-                
-                if gps.satellites_visible < min_satellites:
-                    return CommandResponse(
-                        command_id=MAVLinkCommands.COMPONENT_ARM_DISARM,
-                        result=CommandResult.FAILED,
-                        message=f"Insufficient satellites ({gps.satellites_visible}<{min_satellites})",
-                        execution_time=0.0
-                    )
+        if self.safety_checks_enabled and gps_required:
+            # Snapshot once: the receiver task may replace latest_gps mid-check
+            gps = self.cmd.connection.latest_gps
+            if gps is None:
+                return _ERR_NO_GPS
+            
+            fix_type = gps.fix_type
+            satellites = gps.satellites_visible
+            if fix_type < 3:
+                return replace(_ERR_ARM, message=_ERR_GPS_FIX_FMT.format(fix_type))
+            
+            if satellites < min_satellites:
+                return replace(
+                    _ERR_ARM,
+                    message=_ERR_GPS_SATS_FMT.format(satellites, min_satellites)
+                )
         
         return await self.cmd.arm_disarm(True)
     
@@ -564,7 +852,7 @@ class SafetyCommands:
             CommandResponse with result
         """
         # Switch to LAND mode immediately
-        return await self.cmd.set_mode("LAND")
+        return await self.cmd.set_land_mode()
     
     async def safe_takeoff(self, altitude: float, max_altitude: float = 120.0) -> CommandResponse:
         """
@@ -578,20 +866,13 @@ class SafetyCommands:
             CommandResponse with result
         """
         if altitude > max_altitude:
-            return CommandResponse(
-                command_id=MAVLinkCommands.NAV_TAKEOFF,
-                result=CommandResult.FAILED,
-                message=f"Altitude {altitude}m exceeds maximum {max_altitude}m",
-                execution_time=0.0
+            return replace(
+                _ERR_TAKEOFF,
+                message=_ERR_MAX_ALTITUDE_FMT.format(altitude, max_altitude)
             )
         
         if altitude <= 0:
-            return CommandResponse(
-                command_id=MAVLinkCommands.NAV_TAKEOFF,
-                result=CommandResult.FAILED,
-                message="Takeoff altitude must be positive",
-                execution_time=0.0
-            )
+            return _ERR_TAKEOFF_NOT_POSITIVE
         
         return await self.cmd.takeoff(altitude)
     
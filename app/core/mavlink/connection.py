@@ -3,11 +3,17 @@ MAVLink Connection Manager for Pixhawk communication
 """
 
 import asyncio
+import json
 import logging
+import socket
+import threading
 import time
-from typing import Optional, Dict, Any, Callable
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, Callable, List, Mapping, Tuple
+from dataclasses import dataclass, asdict, replace
 from enum import Enum
+from operator import attrgetter
+from types import MappingProxyType
 import serial
 
 try:
@@ -16,10 +22,62 @@ try:
 except ImportError:
     raise ImportError("pymavlink is required. Install with: pip install pymavlink")
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from app.core.mavlink import _fastdecode
 from config.settings import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Callback lists for message types nobody registered for
+_NO_CALLBACKS: Tuple[List[Callable], List[Callable]] = ([], [])
+
+# Upper bound on frames the reader thread drains before handing off to the loop
+_RX_BATCH_LIMIT = 64
+
+# Flight mode name -> custom mode number, read-only and built once
+_MODE_MAPPING: Mapping[str, int] = MappingProxyType({
+    'MANUAL': 0,
+    'STABILIZE': 0,
+    'GUIDED': 4,
+    'AUTO': 3,
+    'RTL': 6,
+    'LOITER': 5
+})
+
+# GPS fields that not every position message carries, with their defaults
+# (GLOBAL_POSITION_INT has none of them; GPS_RAW_INT-style messages do)
+_GPS_OPTIONAL_FIELDS = (
+    ('hdop', 0),
+    ('vdop', 0),
+    ('vel', 0.0),
+    ('cog', 0),
+    ('satellites_visible', 0),
+    ('fix_type', 0)
+)
+
+# IP type-of-service flag requesting low-delay handling for UDP links
+_IPTOS_LOWDELAY = 0x10
+
+
+def _gps_optional_getter(msg) -> Callable[[Any], tuple]:
+    """Build a reader for the optional GPS fields, defaulting those `msg` lacks"""
+    fields = tuple((name, hasattr(msg, name), default) for name, default in _GPS_OPTIONAL_FIELDS)
+    if not any(present for _, present, _ in fields):
+        defaults = tuple(default for _, _, default in fields)
+        return lambda msg: defaults
+    if all(present for _, present, _ in fields):
+        return attrgetter(*(name for name, _, _ in fields))
+    
+    getters = tuple(
+        attrgetter(name) if present else (lambda msg, default=default: default)
+        for name, present, default in fields
+    )
+    return lambda msg: tuple(get(msg) for get in getters)
+
 
 class ConnectionState(Enum):
     """MAVLink connection states"""
@@ -29,9 +87,14 @@ class ConnectionState(Enum):
     ERROR = "error"
 
 
-@dataclass
+@dataclass(frozen=True)
 class HeartbeatData:
     """Heartbeat message data"""
+    __slots__ = (
+        'timestamp', 'system_id', 'component_id', 'type', 'autopilot',
+        'base_mode', 'custom_mode', 'system_status', 'mavlink_version'
+    )
+    
     timestamp: float
     system_id: int
     component_id: int
@@ -43,9 +106,14 @@ class HeartbeatData:
     mavlink_version: int
 
 
-@dataclass
+@dataclass(frozen=True)
 class GPSData:
     """GPS data structure"""
+    __slots__ = (
+        'timestamp', 'lat', 'lon', 'alt', 'relative_alt', 'hdop', 'vdop',
+        'vel', 'cog', 'satellites_visible', 'fix_type'
+    )
+    
     timestamp: float
     lat: float  # degrees * 1e7
     lon: float  # degrees * 1e7
@@ -59,9 +127,11 @@ class GPSData:
     fix_type: int
 
 
-@dataclass
+@dataclass(frozen=True)
 class AttitudeData:
     """Attitude data structure"""
+    __slots__ = ('timestamp', 'roll', 'pitch', 'yaw', 'rollspeed', 'pitchspeed', 'yawspeed')
+    
     timestamp: float
     roll: float  # radians
     pitch: float  # radians
@@ -82,25 +152,53 @@ class MAVLinkManager:
         self.connection: Optional[mavutil.mavlink_connection] = None
         self.state = ConnectionState.DISCONNECTED
         self.last_heartbeat = 0
+        self._last_heartbeat_mono = 0.0
         self.system_id = 1
         self.component_id = 1
         
-        # Message callbacks
-        self.message_callbacks: Dict[str, list] = {}
+        # Message callbacks: (sync callbacks, coroutine callbacks) per message ID
+        self.message_callbacks: Dict[int, Tuple[List[Callable], List[Callable]]] = {}
+        
+        # Built-in handlers for the message types tracked in latest_*, by message ID
+        self._type_handlers: Dict[int, Callable] = {
+            mavlink.MAVLINK_MSG_ID_HEARTBEAT: self._process_heartbeat,
+            mavlink.MAVLINK_MSG_ID_GLOBAL_POSITION_INT: self._process_gps_data,
+            mavlink.MAVLINK_MSG_ID_ATTITUDE: self._process_attitude_data
+        }
         
         # Latest data
         self.latest_heartbeat: Optional[HeartbeatData] = None
         self.latest_gps: Optional[GPSData] = None
         self.latest_attitude: Optional[AttitudeData] = None
         
+        # Raw payload of the last GPS/attitude frame, to skip rebuilding unchanged data
+        self._last_gps_key: Optional[tuple] = None
+        self._last_attitude_key: Optional[tuple] = None
+        self._gps_msg_cls: Optional[type] = None
+        self._gps_optional: Callable[[Any], tuple] = _gps_optional_getter(None)
+        
         # Background tasks
         self._heartbeat_task: Optional[asyncio.Task] = None
         self._message_task: Optional[asyncio.Task] = None
         
+        # Receiver thread: blocking reads feed the async message processor
+        self._rx_queue: Optional[asyncio.Queue] = None
+        self._rx_thread: Optional[threading.Thread] = None
+        self._rx_stop = threading.Event()
+        
+        # pymavlink writes block; a single sender thread keeps them off the
+        # event loop while preserving MAVLink sequence order
+        self._send_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="mavlink-tx")
+        
         # Connection monitoring
         self.connection_timeout = self.settings.MAVLINK_TIMEOUT
         self.heartbeat_timeout = 5.0  # seconds
         
+        # Messages are stamped from the event loop's monotonic clock; this
+        # offset maps those stamps back to wall-clock time for API consumers.
+        # It is re-derived per receive batch so NTP steps don't skew every age
+        self._wall_offset = 0.0
+        
         self.serial = None
     
     async def connect(self) -> bool:
@@ -128,6 +226,9 @@ class MAVLinkManager:
                     timeout=self.connection_timeout
                 )
             
+            self._configure_low_latency()
+            _fastdecode.install(self.connection.mav)
+            
             # Wait for first heartbeat
             logger.info("Waiting for heartbeat...")
             heartbeat_received = await self._wait_for_heartbeat()
@@ -149,6 +250,22 @@ class MAVLinkManager:
             logger.error(f"Failed to connect to MAVLink: {e}")
             return False
     
+    def _configure_low_latency(self):
+        """Tune the underlying port for small, latency-critical command frames"""
+        port = getattr(self.connection, 'port', None)
+        if port is None:
+            return
+        
+        try:
+            if isinstance(port, serial.Serial):
+                # Linux ASYNC_LOW_LATENCY: USB-serial adapters flush immediately
+                # instead of batching bytes on their latency timer
+                port.set_low_latency_mode(True)
+            elif isinstance(port, socket.socket) and port.type == socket.SOCK_DGRAM:
+                port.setsockopt(socket.IPPROTO_IP, socket.IP_TOS, _IPTOS_LOWDELAY)
+        except (AttributeError, ValueError, OSError) as e:
+            logger.debug(f"Low-latency mode not available on this link: {e}")
+    
     async def disconnect(self):
         """Disconnect from MAVLink"""
         logger.info("Disconnecting from MAVLink")
@@ -173,13 +290,15 @@ class MAVLinkManager:
     
     async def _wait_for_heartbeat(self, timeout: float = 10.0) -> bool:
         """Wait for heartbeat message"""
-        start_time = time.time()
+        loop = asyncio.get_event_loop()
+        self._wall_offset = time.time() - loop.time()
+        start_time = loop.time()
         
-        while time.time() - start_time < timeout:
+        while loop.time() - start_time < timeout:
             try:
                 msg = self.connection.recv_match(type='HEARTBEAT', blocking=False, timeout=1.0)
                 if msg:
-                    self._process_heartbeat(msg)
+                    self._process_heartbeat(msg, loop.time())
                     return True
             except Exception as e:
                 logger.warning(f"Error waiting for heartbeat: {e}")
@@ -190,6 +309,14 @@ class MAVLinkManager:
     
     async def _start_background_tasks(self):
         """Start background message processing tasks"""
+        loop = asyncio.get_event_loop()
+        self._rx_queue = asyncio.Queue(maxsize=1024)
+        self._rx_stop.clear()
+        self._rx_thread = threading.Thread(
+            target=self._reader_thread, args=(loop,), name="mavlink-rx", daemon=True
+        )
+        self._rx_thread.start()
+        
         self._heartbeat_task = asyncio.create_task(self._heartbeat_monitor())
         self._message_task = asyncio.create_task(self._message_processor())
     
@@ -208,64 +335,124 @@ class MAVLinkManager:
                 await self._message_task
             except asyncio.CancelledError:
                 pass
+        
+        if self._rx_thread:
+            self._rx_stop.set()
+            await asyncio.get_event_loop().run_in_executor(None, self._rx_thread.join, 2.0)
+            self._rx_thread = None
     
     async def _heartbeat_monitor(self):
         """Monitor heartbeat messages and connection health"""
+        loop = asyncio.get_event_loop()
         while self.state == ConnectionState.CONNECTED:
             try:
-                current_time = time.time()
-                if current_time - self.last_heartbeat > self.heartbeat_timeout:
+                remaining = self._last_heartbeat_mono + self.heartbeat_timeout - loop.time()
+                if remaining <= 0:
                     logger.warning("Heartbeat timeout - connection may be lost")
                     self.state = ConnectionState.ERROR
                     break
                 
-                await asyncio.sleep(1.0)
+                # Sleep until the current deadline; heartbeats received meanwhile
+                # only move _last_heartbeat_mono, so nothing is rescheduled per message
+                await asyncio.sleep(remaining)
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 logger.error(f"Error in heartbeat monitor: {e}")
     
+    def _reader_thread(self, loop: asyncio.AbstractEventLoop):
+        """Read MAVLink messages with blocking receives (runs on its own thread)"""
+        while not self._rx_stop.is_set():
+            try:
+                msg = self.connection.recv_match(blocking=True, timeout=1.0)
+                if msg is None:
+                    continue
+                
+                # Drain frames already buffered before blocking again, and hand
+                # them to the loop in one wakeup
+                batch = [msg]
+                while len(batch) < _RX_BATCH_LIMIT:
+                    msg = self.connection.recv_match(blocking=False)
+                    if msg is None:
+                        break
+                    batch.append(msg)
+                loop.call_soon_threadsafe(self._enqueue_messages, batch)
+            except Exception as e:
+                if self._rx_stop.is_set():
+                    break
+                logger.error(f"Error reading message: {e}")
+                time.sleep(0.1)
+    
+    def _enqueue_messages(self, batch):
+        """Queue received messages for processing, dropping them if the queue is full"""
+        if self._rx_stop.is_set():
+            # Batches posted just before the reader stopped; nothing consumes them
+            return
+        for msg in batch:
+            try:
+                self._rx_queue.put_nowait(msg)
+            except asyncio.QueueFull:
+                logger.warning("Receive queue full, dropping MAVLink message")
+    
     async def _message_processor(self):
         """Process incoming MAVLink messages"""
+        loop = asyncio.get_event_loop()
+        queue = self._rx_queue
         while self.state == ConnectionState.CONNECTED:
             try:
-                msg = self.connection.recv_match(blocking=False, timeout=0.1)
-                if msg:
-                    await self._process_message(msg)
-                else:
-                    await asyncio.sleep(0.01)  # Small delay to prevent busy loop
+                msg = await queue.get()
+                
+                # One clock read stamps the whole batch, and one wall-clock read
+                # keeps the offset in step with NTP adjustments
+                now = loop.time()
+                self._wall_offset = time.time() - now
+                await self._process_message(msg, now)
+                
+                # Drain whatever else arrived without going back to the scheduler
+                while True:
+                    try:
+                        msg = queue.get_nowait()
+                    except asyncio.QueueEmpty:
+                        break
+                    await self._process_message(msg, now)
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 logger.error(f"Error processing message: {e}")
-                await asyncio.sleep(0.1)
+        
+        # Nothing drains the queue from here on (e.g. after a heartbeat timeout),
+        # so stop the reader like a blocking read loop would
+        self._rx_stop.set()
     
-    async def _process_message(self, msg):
-        """Process individual MAVLink message"""
-        msg_type = msg.get_type()
+    async def _process_message(self, msg, now: float):
+        """Process individual MAVLink message received at loop time `now`"""
+        msg_id = msg.get_msgId()
         
         # Process specific message types
-        if msg_type == 'HEARTBEAT':
-            self._process_heartbeat(msg)
-        elif msg_type == 'GLOBAL_POSITION_INT':
-            self._process_gps_data(msg)
-        elif msg_type == 'ATTITUDE':
-            self._process_attitude_data(msg)
+        handler = self._type_handlers.get(msg_id)
+        if handler is not None:
+            handler(msg, now)
         
         # Call registered callbacks
-        if msg_type in self.message_callbacks:
-            for callback in self.message_callbacks[msg_type]:
-                try:
-                    if asyncio.iscoroutinefunction(callback):
-                        await callback(msg)
-                    else:
-                        callback(msg)
-                except Exception as e:
-                    logger.error(f"Error in message callback: {e}")
-    
-    def _process_heartbeat(self, msg):
+        sync_callbacks, coro_callbacks = self.message_callbacks.get(msg_id, _NO_CALLBACKS)
+        for callback in sync_callbacks:
+            try:
+                callback(msg)
+            except Exception as e:
+                logger.error(f"Error in message callback: {e}")
+        
+        if coro_callbacks:
+            results = await asyncio.gather(
+                *[callback(msg) for callback in coro_callbacks], return_exceptions=True
+            )
+            for result in results:
+                if isinstance(result, Exception):
+                    logger.error(f"Error in message callback: {result}")
+    
+    def _process_heartbeat(self, msg, now: float):
         """Process heartbeat message"""
-        self.last_heartbeat = time.time()
+        self._last_heartbeat_mono = now
+        self.last_heartbeat = now + self._wall_offset
         self.system_id = msg.get_srcSystem()
         self.component_id = msg.get_srcComponent()
         
@@ -281,26 +468,56 @@ class MAVLinkManager:
             mavlink_version=msg.mavlink_version
         )
     
-    def _process_gps_data(self, msg):
+    def _process_gps_data(self, msg, now: float):
         """Process GPS data message"""
+        timestamp = now + self._wall_offset
+        
+        # The message class is fixed per link, so resolve which optional
+        # fields it carries once instead of getattr-with-default per frame
+        msg_cls = type(msg)
+        if msg_cls is not self._gps_msg_cls:
+            self._gps_msg_cls = msg_cls
+            self._gps_optional = _gps_optional_getter(msg)
+        key = (msg.lat, msg.lon, msg.alt, msg.relative_alt) + self._gps_optional(msg)
+        
+        # Unchanged fix (common while stationary): copy the cached struct with a
+        # new timestamp instead of unpacking the frame again
+        if key == self._last_gps_key:
+            self.latest_gps = replace(self.latest_gps, timestamp=timestamp)
+            return
+        
+        self._last_gps_key = key
+        lat, lon, alt, relative_alt, hdop, vdop, vel, cog, satellites_visible, fix_type = key
         self.latest_gps = GPSData(
-            timestamp=time.time(),
-            lat=msg.lat,
-            lon=msg.lon,
-            alt=msg.alt,
-            relative_alt=msg.relative_alt,
-            hdop=getattr(msg, 'hdop', 0) / 100.0,  # Use getattr with default 0
-            vdop=getattr(msg, 'vdop', 0) / 100.0,  # Use getattr with default 0
-            vel=getattr(msg, 'vel', 0.0),
-            cog=getattr(msg, 'cog', 0),
-            satellites_visible=getattr(msg, 'satellites_visible', 0),
-            fix_type=getattr(msg, 'fix_type', 0)
+            timestamp=timestamp,
+            lat=lat,
+            lon=lon,
+            alt=alt,
+            relative_alt=relative_alt,
+            hdop=hdop / 100.0,
+            vdop=vdop / 100.0,
+            vel=vel,
+            cog=cog,
+            satellites_visible=satellites_visible,
+            fix_type=fix_type
         )
     
-    def _process_attitude_data(self, msg):
+    def _process_attitude_data(self, msg, now: float):
         """Process attitude data message"""
+        timestamp = now + self._wall_offset
+        
+        # Raw samples always differ by sensor noise, so compare at milliradian resolution
+        key = (
+            round(msg.roll * 1000), round(msg.pitch * 1000), round(msg.yaw * 1000),
+            round(msg.rollspeed * 1000), round(msg.pitchspeed * 1000), round(msg.yawspeed * 1000)
+        )
+        if key == self._last_attitude_key:
+            self.latest_attitude = replace(self.latest_attitude, timestamp=timestamp)
+            return
+        
+        self._last_attitude_key = key
         self.latest_attitude = AttitudeData(
-            timestamp=time.time(),
+            timestamp=timestamp,
             roll=msg.roll,
             pitch=msg.pitch,
             yaw=msg.yaw,
@@ -309,19 +526,34 @@ class MAVLinkManager:
             yawspeed=msg.yawspeed
         )
     
+    @staticmethod
+    def _resolve_message_id(message_type: str) -> int:
+        """Resolve a MAVLink message name (e.g. 'HEARTBEAT') to its numeric ID"""
+        msg_id = getattr(mavutil.mavlink, f"MAVLINK_MSG_ID_{message_type}", None)
+        if msg_id is None:
+            raise ValueError(f"Unknown MAVLink message type: {message_type}")
+        return msg_id
+    
     def register_message_callback(self, message_type: str, callback: Callable):
         """Register callback for specific message type"""
-        if message_type not in self.message_callbacks:
-            self.message_callbacks[message_type] = []
-        self.message_callbacks[message_type].append(callback)
+        msg_id = self._resolve_message_id(message_type)
+        if msg_id not in self.message_callbacks:
+            self.message_callbacks[msg_id] = ([], [])
+        
+        # Classify once here instead of on every message
+        is_coroutine = asyncio.iscoroutinefunction(callback)
+        self.message_callbacks[msg_id][is_coroutine].append(callback)
     
     def unregister_message_callback(self, message_type: str, callback: Callable):
         """Unregister message callback"""
-        if message_type in self.message_callbacks:
-            try:
-                self.message_callbacks[message_type].remove(callback)
-            except ValueError:
-                pass
+        msg_id = self._resolve_message_id(message_type)
+        if msg_id in self.message_callbacks:
+            for callbacks in self.message_callbacks[msg_id]:
+                try:
+                    callbacks.remove(callback)
+                    return
+                except ValueError:
+                    pass
     
     async def send_command_long(self, command: int, param1: float = 0, param2: float = 0,
                                param3: float = 0, param4: float = 0, param5: float = 0,
@@ -332,33 +564,76 @@ class MAVLinkManager:
             return False
         
         try:
-            self.connection.mav.command_long_send(
+            await asyncio.get_event_loop().run_in_executor(
+                self._send_executor,
+                self.connection.mav.command_long_send,
                 self.system_id, self.component_id,
                 command, 0,  # confirmation
                 param1, param2, param3, param4, param5, param6, param7
             )
-            logger.debug(f"Sent command {command}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Sent command %d", command)
             return True
         except Exception as e:
             logger.error(f"Failed to send command {command}: {e}")
             return False
     
+    async def send_command_long_batch(self, commands: List[Tuple[int, Tuple[float, ...]]]) -> bool:
+        """Send several COMMAND_LONG messages in a single write"""
+        if not self.is_connected():
+            logger.error("Cannot send commands: not connected")
+            return False
+        
+        try:
+            await asyncio.get_event_loop().run_in_executor(
+                self._send_executor, self._write_command_batch, commands
+            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Sent %d commands in one write", len(commands))
+            return True
+        except Exception as e:
+            logger.error(f"Failed to send command batch: {e}")
+            return False
+    
+    def _write_command_batch(self, commands: List[Tuple[int, Tuple[float, ...]]]):
+        """Pack COMMAND_LONG messages and write them at once (runs on the sender thread)"""
+        mav = self.connection.mav
+        buf = bytearray()
+        for command, params in commands:
+            msg = mav.command_long_encode(
+                self.system_id, self.component_id,
+                command, 0,  # confirmation
+                *params
+            )
+            buf += msg.pack(mav)
+            mav.seq = (mav.seq + 1) % 256
+        
+        mav.file.write(bytes(buf))
+        mav.total_packets_sent += len(commands)
+        mav.total_bytes_sent += len(buf)
+    
+    async def send_message(self, msg) -> bool:
+        """Send an already encoded MAVLink message (e.g. from mav.mission_item_int_encode)"""
+        if not self.is_connected():
+            logger.error("Cannot send message: not connected")
+            return False
+        
+        try:
+            await asyncio.get_event_loop().run_in_executor(
+                self._send_executor, self.connection.mav.send, msg
+            )
+            return True
+        except Exception as e:
+            logger.error(f"Failed to send {msg.get_type()}: {e}")
+            return False
+    
     async def set_mode(self, mode: str) -> bool:
         """Set flight mode"""
-        mode_mapping = {
-            'MANUAL': 0,
-            'STABILIZE': 0,
-            'GUIDED': 4,
-            'AUTO': 3,
-            'RTL': 6,
-            'LOITER': 5
-        }
-        
-        if mode.upper() not in mode_mapping:
+        mode_id = _MODE_MAPPING.get(mode.upper())
+        if mode_id is None:
             logger.error(f"Unknown mode: {mode}")
             return False
         
-        mode_id = mode_mapping[mode.upper()]
         return await self.send_command_long(
             mavlink.MAV_CMD_DO_SET_MODE,
             mavlink.MAV_MODE_FLAG_CUSTOM_MODE_ENABLED,
@@ -375,6 +650,21 @@ class MAVLinkManager:
     
     def get_status(self) -> Dict[str, Any]:
         """Get current MAVLink connection status"""
+        status = self._status_snapshot()
+        for key in ("latest_heartbeat", "latest_gps", "latest_attitude"):
+            if status[key] is not None:
+                status[key] = asdict(status[key])
+        return status
+    
+    def get_status_json(self) -> bytes:
+        """Get current MAVLink connection status encoded as JSON"""
+        if orjson is None:
+            return json.dumps(self.get_status()).encode()
+        # orjson encodes the telemetry dataclasses directly, without asdict copies
+        return orjson.dumps(self._status_snapshot())
+    
+    def _status_snapshot(self) -> Dict[str, Any]:
+        """Status fields with the latest telemetry structs left as-is"""
         return {
             "state": self.state.value,
             "connected": self.is_connected(),
@@ -383,9 +673,9 @@ class MAVLinkManager:
             "component_id": self.component_id,
             "last_heartbeat": self.last_heartbeat,
             "heartbeat_age": time.time() - self.last_heartbeat if self.last_heartbeat else None,
-            "latest_heartbeat": self.latest_heartbeat.__dict__ if self.latest_heartbeat else None,
-            "latest_gps": self.latest_gps.__dict__ if self.latest_gps else None,
-            "latest_attitude": self.latest_attitude.__dict__ if self.latest_attitude else None
+            "latest_heartbeat": self.latest_heartbeat,
+            "latest_gps": self.latest_gps,
+            "latest_attitude": self.latest_attitude
         }
 
     def connect_serial(self):
@@ -1,20 +1,36 @@
 class SafetyManager:
     def __init__(self, geofence=None):
-        self.geofence = geofence or []  # List of (lat, lon) tuples
+        self.set_geofence(geofence or [])  # List of (lat, lon) tuples
         self.emergency_stopped = False
 
+    def set_geofence(self, points):
+        self.geofence = points
+        # Cache the bounding box once instead of rescanning the fence per fix
+        self._bounds = None
+        if points:
+            min_lat = max_lat = points[0][0]
+            min_lon = max_lon = points[0][1]
+            for point in points:
+                lat, lon = point[0], point[1]
+                if lat < min_lat:
+                    min_lat = lat
+                elif lat > max_lat:
+                    max_lat = lat
+                if lon < min_lon:
+                    min_lon = lon
+                elif lon > max_lon:
+                    max_lon = lon
+            self._bounds = (min_lat, max_lat, min_lon, max_lon)
+
     def check_arming(self, system_status):
         # Example: Check if all pre-arm checks are passed
         return system_status.get('prearm_check', True)
 
     def validate_geofence(self, lat, lon):
         # Simple geofence: bounding box
-        if not self.geofence:
+        if self._bounds is None:
             return True
-        min_lat = min(p[0] for p in self.geofence)
-        max_lat = max(p[0] for p in self.geofence)
-        min_lon = min(p[1] for p in self.geofence)
-        max_lon = max(p[1] for p in self.geofence)
+        min_lat, max_lat, min_lon, max_lon = self._bounds
         return min_lat <= lat <= max_lat and min_lon <= lon <= max_lon
 
     def trigger_emergency_stop(self):
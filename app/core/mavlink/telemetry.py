@@ -1,11 +1,25 @@
+import numpy as np
+
+# GPS history ring buffer; size must be a power of two so the write index can be masked
+GPS_HISTORY_SIZE = 1024
+_GPS_HISTORY_MASK = GPS_HISTORY_SIZE - 1
+_GPS_HISTORY_DTYPE = np.dtype([('t', 'f8'), ('lat', 'f8'), ('lon', 'f8'), ('alt', 'f4')])
+
+
 class TelemetryManager:
     def __init__(self):
         self.gps = None
         self.attitude = None
         self.battery = None
+        self._gps_hist = np.zeros(GPS_HISTORY_SIZE, dtype=_GPS_HISTORY_DTYPE)
+        self._gps_w = 0  # total samples written; slot is _gps_w & mask
 
     def update_gps(self, gps_data):
         self.gps = gps_data
+        self._gps_hist[self._gps_w & _GPS_HISTORY_MASK] = (
+            gps_data.timestamp, gps_data.lat, gps_data.lon, gps_data.alt
+        )
+        self._gps_w += 1
 
     def update_attitude(self, attitude_data):
         self.attitude = attitude_data
@@ -13,9 +27,17 @@ class TelemetryManager:
     def update_battery(self, battery_data):
         self.battery = battery_data
 
+    def get_gps_history(self):
+        # Oldest to newest copy of the valid window
+        if self._gps_w <= GPS_HISTORY_SIZE:
+            return self._gps_hist[:self._gps_w].copy()
+        split = self._gps_w & _GPS_HISTORY_MASK
+        return np.concatenate((self._gps_hist[split:], self._gps_hist[:split]))
+
     def get_telemetry(self):
         return {
             'gps': self.gps,
+            'gps_history': self.get_gps_history(),
             'attitude': self.attitude,
             'battery': self.battery
         }
@@ -1,11 +1,41 @@
+import math
+
+import numpy as np
+
+
 class PatternGenerator:
+    # Patterns are built as (N, 3) float64 arrays of [lat, lon, alt] rows;
+    # to_dicts converts them to waypoint dicts at the API edge
+
     def generate_square(self, center_lat, center_lon, size, alt):
         # Returns waypoints for a square pattern
+        return self.to_dicts(self.generate_square_array(center_lat, center_lon, size, alt))
+
+    def generate_square_array(self, center_lat, center_lon, size, alt):
         half = size / 2.0
+        lats = center_lat + np.array([-half, -half, half, half, -half])
+        lons = center_lon + np.array([-half, half, half, -half, -half])
+        return np.stack([lats, lons, np.full(5, float(alt))], axis=1)
+
+    def generate_raster(self, center_lat, center_lon, width, height, spacing, alt):
+        # Lawnmower coverage of a width x height area around the center (same
+        # offset units as generate_square), rows alternating direction
+        num_cols = math.floor(width / spacing + 1e-9) + 1
+        num_rows = math.floor(height / spacing + 1e-9) + 1
+        xs = np.arange(num_cols) * spacing - width / 2.0
+        ys = np.arange(num_rows) * spacing - height / 2.0
+
+        grid_x = np.empty((num_rows, num_cols))
+        grid_x[0::2] = xs
+        grid_x[1::2] = xs[::-1]
+
+        lats = center_lat + np.repeat(ys, num_cols)
+        lons = center_lon + grid_x.ravel()
+        return np.stack([lats, lons, np.full(lats.shape[0], float(alt))], axis=1)
+
+    @staticmethod
+    def to_dicts(waypoints):
         return [
-            {'lat': center_lat - half, 'lon': center_lon - half, 'alt': alt},
-            {'lat': center_lat - half, 'lon': center_lon + half, 'alt': alt},
-            {'lat': center_lat + half, 'lon': center_lon + half, 'alt': alt},
-            {'lat': center_lat + half, 'lon': center_lon - half, 'alt': alt},
-            {'lat': center_lat - half, 'lon': center_lon - half, 'alt': alt},
+            {'lat': lat, 'lon': lon, 'alt': alt}
+            for lat, lon, alt in waypoints.tolist()
         ]
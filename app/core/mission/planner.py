@@ -1,3 +1,17 @@
+import asyncio
+import logging
+
+import numpy as np
+from pymavlink.dialects.v20 import common as mavlink
+
+from app.core.mission.waypoints import WAYPOINT_DTYPE
+
+logger = logging.getLogger(__name__)
+
+# Vehicle-side messages that drive a mission upload
+_UPLOAD_MESSAGES = ('MISSION_REQUEST_INT', 'MISSION_REQUEST', 'MISSION_ACK')
+
+
 class MissionPlanner:
     def __init__(self, waypoint_manager, pattern_generator):
         self.waypoint_manager = waypoint_manager
@@ -7,9 +21,92 @@ class MissionPlanner:
     def create_mission(self, waypoints):
         self.current_mission = waypoints
 
-    def execute_mission(self):
-        # Logic to send waypoints to Pixhawk for execution
-        return self.current_mission
+    async def execute_mission(self, mavlink_manager, timeout=2.0, retries=3):
+        # Upload the current mission with the MAVLink mission protocol:
+        # MISSION_COUNT, then one MISSION_ITEM_INT per vehicle request, until
+        # MISSION_ACK. Items are encoded up front so each request is answered
+        # with a single send instead of building the message per round trip
+        waypoints = self._mission_array()
+        if len(waypoints) == 0:
+            logger.error("Cannot upload mission: no waypoints")
+            return False
+
+        mav = mavlink_manager.connection.mav
+        target_system = mavlink_manager.system_id
+        target_component = mavlink_manager.component_id
+        xs = np.round(waypoints['lat'] * 1e7).astype(np.int32).tolist()
+        ys = np.round(waypoints['lon'] * 1e7).astype(np.int32).tolist()
+        zs = waypoints['alt'].tolist()
+        # ArduPilot treats seq 0 as home and overwrites it, so a placeholder at
+        # the first waypoint goes there and the waypoints start at seq 1
+        items = [
+            mav.mission_item_int_encode(
+                target_system, target_component, 0,
+                mavlink.MAV_FRAME_GLOBAL_INT,
+                mavlink.MAV_CMD_NAV_WAYPOINT,
+                0, 1,
+                0, 0, 0, 0,
+                xs[0], ys[0], 0
+            )
+        ]
+        items += [
+            mav.mission_item_int_encode(
+                target_system, target_component, seq,
+                mavlink.MAV_FRAME_GLOBAL_RELATIVE_ALT_INT,
+                mavlink.MAV_CMD_NAV_WAYPOINT,
+                0, 1,  # current, autocontinue
+                0, 0, 0, 0,
+                x, y, z
+            )
+            for seq, (x, y, z) in enumerate(zip(xs, ys, zs), start=1)
+        ]
+        count_msg = mav.mission_count_encode(target_system, target_component, len(items))
+
+        replies = asyncio.Queue()
+        for message_type in _UPLOAD_MESSAGES:
+            mavlink_manager.register_message_callback(message_type, replies.put_nowait)
+        try:
+            last_sent = count_msg
+            if not await mavlink_manager.send_message(count_msg):
+                return False
+
+            attempts = 0
+            while True:
+                try:
+                    reply = await asyncio.wait_for(replies.get(), timeout)
+                except asyncio.TimeoutError:
+                    attempts += 1
+                    if attempts > retries:
+                        logger.error("Mission upload timed out")
+                        return False
+                    # Request or item lost on the link: repeat the last message
+                    await mavlink_manager.send_message(last_sent)
+                    continue
+
+                attempts = 0
+                if reply.get_msgId() == mavlink.MAVLINK_MSG_ID_MISSION_ACK:
+                    if reply.type != mavlink.MAV_MISSION_ACCEPTED:
+                        logger.error(f"Mission upload rejected (result {reply.type})")
+                        return False
+                    logger.info(f"Mission uploaded: {len(waypoints)} waypoints")
+                    return True
+
+                if 0 <= reply.seq < len(items):
+                    last_sent = items[reply.seq]
+                    await mavlink_manager.send_message(last_sent)
+        finally:
+            for message_type in _UPLOAD_MESSAGES:
+                mavlink_manager.unregister_message_callback(message_type, replies.put_nowait)
 
     def get_current_mission(self):
         return self.current_mission
+
+    def _mission_array(self):
+        # current_mission is either a waypoint record array or a list of
+        # {'lat', 'lon', 'alt'} dicts as produced by the pattern generator
+        if isinstance(self.current_mission, np.ndarray):
+            return self.current_mission
+        return np.array(
+            [(wp['lat'], wp['lon'], wp['alt']) for wp in self.current_mission],
+            dtype=WAYPOINT_DTYPE
+        )
@@ -1,13 +1,42 @@
+import numpy as np
+
+WAYPOINT_DTYPE = np.dtype([('lat', 'f8'), ('lon', 'f8'), ('alt', 'f4')])
+
+
 class WaypointManager:
-    def __init__(self):
-        self.waypoints = []
+    # Waypoints live in a structured array that grows by doubling; only the
+    # first _len rows are valid. as_dicts converts at the API edge
+
+    def __init__(self, capacity=16):
+        self._buffer = np.zeros(capacity, dtype=WAYPOINT_DTYPE)
+        self._len = 0
+
+    @property
+    def waypoints(self):
+        return self._buffer[:self._len]
+
+    def __len__(self):
+        return self._len
 
     def add_waypoint(self, lat, lon, alt):
-        self.waypoints.append({'lat': lat, 'lon': lon, 'alt': alt})
+        if self._len == len(self._buffer):
+            grown = np.zeros(max(2 * len(self._buffer), 1), dtype=WAYPOINT_DTYPE)
+            grown[:self._len] = self._buffer
+            self._buffer = grown
+        self._buffer[self._len] = (lat, lon, alt)
+        self._len += 1
 
     def remove_waypoint(self, index):
-        if 0 <= index < len(self.waypoints):
-            self.waypoints.pop(index)
+        if 0 <= index < self._len:
+            # Shift the tail down by one row (a single memmove)
+            self._buffer[index:self._len - 1] = self._buffer[index + 1:self._len]
+            self._len -= 1
 
     def list_waypoints(self):
         return self.waypoints
+
+    def as_dicts(self):
+        return [
+            {'lat': lat, 'lon': lon, 'alt': alt}
+            for lat, lon, alt in self.waypoints.tolist()
+        ]
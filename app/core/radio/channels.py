@@ -1,12 +1,35 @@
+import numpy as np
+
+
 class ChannelMapper:
+    NUM_CHANNELS = 18
+    # Channel name -> slot in the value buffer (RC channel number - 1)
+    CHANNEL_INDEX = {
+        'roll': 0, 'pitch': 1, 'throttle': 2, 'yaw': 3, 'mode': 4,
+        **{f'aux{n}': 4 + n for n in range(1, NUM_CHANNELS - 4)}
+    }
+
     def __init__(self, channel_map=None):
-        self.channel_map = channel_map or {}
+        self._values = np.zeros(self.NUM_CHANNELS, dtype=np.uint16)
+        self._present = np.zeros(self.NUM_CHANNELS, dtype=bool)
+        self._extra = {}  # Names outside CHANNEL_INDEX
+        for name, value in (channel_map or {}).items():
+            self.set_channel(name, value)
 
     def set_channel(self, name, value):
-        self.channel_map[name] = value
+        index = self.CHANNEL_INDEX.get(name)
+        if index is None:
+            self._extra[name] = value
+            return
+        self._values[index] = value
+        self._present[index] = True
 
     def get_channel(self, name):
-        return self.channel_map.get(name, None)
+        index = self.CHANNEL_INDEX.get(name)
+        if index is None:
+            return self._extra.get(name, None)
+        return int(self._values[index]) if self._present[index] else None
 
     def all_channels(self):
-        return self.channel_map
+        # Zero-copy view of the raw values, indexed by RC channel number - 1
+        return memoryview(self._values)
@@ -1,9 +1,34 @@
+import time
+
+# Hysteresis band: signal counts as lost below LOST, restored only above RESTORED
+SIGNAL_LOST_THRESHOLD = 0.05
+SIGNAL_RESTORED_THRESHOLD = 0.2
+LOSS_DEBOUNCE_S = 0.05
+
+
 class FailsafeManager:
     def __init__(self):
         self.signal_lost = False
+        self._lost_since = None
 
-    def update_signal(self, signal_strength):
-        self.signal_lost = signal_strength < 0.1  # Example threshold
+    def update_signal(self, signal_strength, debounce=True):
+        # Called on every RC frame; in steady state this is just the compares.
+        # debounce=False evaluates a single reading (e.g. from the API) at once
+        if signal_strength < SIGNAL_LOST_THRESHOLD:
+            if self._lost_since is None:
+                self._lost_since = time.monotonic()
+            if not self.signal_lost and (
+                not debounce or time.monotonic() - self._lost_since > LOSS_DEBOUNCE_S
+            ):
+                # Fire once the loss has persisted, not on a single bad frame
+                self.signal_lost = True
+                self.trigger_failsafe()
+        else:
+            # Any frame above the loss threshold breaks the run of bad frames;
+            # an active failsafe clears only once the signal is clearly back
+            self._lost_since = None
+            if signal_strength > SIGNAL_RESTORED_THRESHOLD:
+                self.signal_lost = False
         return self.signal_lost
 
     def trigger_failsafe(self):
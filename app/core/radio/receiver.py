@@ -1,12 +1,46 @@
+import numpy as np
+
+
 class Receiver:
+    NUM_CHANNELS = 18
+
     def __init__(self):
-        self.channels = {}
+        # RC channel N is stored at slot N - 1
+        self._values = np.zeros(self.NUM_CHANNELS, dtype=np.uint16)
+        self._present = np.zeros(self.NUM_CHANNELS, dtype=bool)
+        self._extra = {}  # Keys that are not channel numbers
+
+    def _index(self, channel):
+        try:
+            index = int(channel) - 1
+        except (TypeError, ValueError):
+            return None
+        return index if 0 <= index < self.NUM_CHANNELS else None
 
     def update_channel(self, channel, value):
-        self.channels[channel] = value
+        index = self._index(channel)
+        if index is None:
+            self._extra[channel] = value
+            return
+        self._values[index] = value
+        self._present[index] = True
+
+    def update_channels(self, channels):
+        for channel, value in channels.items():
+            self.update_channel(channel, value)
 
     def get_channel(self, channel):
-        return self.channels.get(channel, None)
+        index = self._index(channel)
+        if index is None:
+            return self._extra.get(channel, None)
+        return int(self._values[index]) if self._present[index] else None
 
     def get_all_channels(self):
-        return self.channels
+        indices = np.flatnonzero(self._present)
+        channels = dict(zip((indices + 1).tolist(), self._values[indices].tolist()))
+        channels.update(self._extra)
+        return channels
+
+    def channel_values(self):
+        # Zero-copy view of the raw values for mixing/scaling code
+        return memoryview(self._values)
@@ -2,13 +2,293 @@
 Pydantic models for backend communication API endpoints
 """
 
-from typing import Optional, Dict, Any, List
-from pydantic import BaseModel, Field, validator
+import math
+import sys
+from dataclasses import dataclass, fields
+from itertools import islice
+from typing import Optional, Dict, Any, Iterator, List, Literal, Tuple, Type, Union
+from pydantic import BaseModel, Field, confloat, conint, root_validator, validator
+from pydantic.json import pydantic_encoder
 from datetime import datetime
 
+import msgpack
+import numpy as np
+import orjson
+
+# Content type for binary (schema-driven MessagePack) telemetry batches
+MSGPACK_CONTENT_TYPE = "application/msgpack"
+
+# Allowed values for enumerated string fields (checked by pydantic's Literal validator)
+ConnectionStatus = Literal["connected", "disconnected", "error", "authenticating"]
+
+CommandType = Literal[
+    "set_mode", "arm_motors", "disarm_motors", "takeoff", "land", "rtl",
+    "goto_position", "set_speed", "emergency_stop", "start_mission",
+    "stop_mission", "update_config", "reboot", "diagnostics"
+]
+
+HealthStatus = Literal["healthy", "degraded", "unhealthy", "unreachable"]
+
+StreamDataType = Literal["gps", "telemetry", "status", "logs", "camera", "sensors"]
+
+# Free-form identifier fields repeated across every message from/to one robot;
+# interned so each distinct value is stored once. (Literal fields above already
+# resolve to the shared constant.)
+_INTERNED_FIELDS = ('robot_id', 'mode')
+
+
+# orjson options for every model dump, combined once (a functools.partial
+# over orjson.dumps measured slower than passing this constant)
+_ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC
+
+
+def _orjson_dumps(v, *, default) -> str:
+    """json_dumps hook for pydantic (which expects str, orjson returns bytes)"""
+    return orjson.dumps(v, default=default, option=_ORJSON_OPTIONS).decode()
+
+
+# Model class -> names of its Optional fields, classified once on first dump
+_OPTIONAL_FIELDS: Dict[type, Tuple[str, ...]] = {}
+
+
+def _model_default(obj):
+    """orjson default hook: encode (nested) models straight from their field values"""
+    if isinstance(obj, BaseModel):
+        return obj.__dict__
+    return pydantic_encoder(obj)
+
+
+def _compact_model_default(obj):
+    """Like _model_default, but leave out Optional fields that are None"""
+    if not isinstance(obj, BaseModel):
+        return pydantic_encoder(obj)
+    cls = type(obj)
+    optional = _OPTIONAL_FIELDS.get(cls)
+    if optional is None:
+        optional = _OPTIONAL_FIELDS[cls] = tuple(
+            name for name, field in cls.__fields__.items() if field.allow_none
+        )
+    values = obj.__dict__
+    missing = [name for name in optional if values[name] is None]
+    if not missing:
+        return values
+    values = values.copy()
+    for name in missing:
+        del values[name]
+    return values
+
+
+def dump_json(model: BaseModel, exclude_none: bool = False) -> bytes:
+    """Serialize a model to JSON bytes in one orjson pass
+    
+    Equivalent to ``orjson.dumps(model.dict(exclude_none=...))`` for models
+    without aliases or include/exclude rules, but skips the intermediate
+    deep-copied dict that ``.dict()`` builds (the whole data point list for a
+    telemetry batch). With exclude_none only the Optional fields are checked.
+    """
+    return orjson.dumps(
+        model,
+        default=_compact_model_default if exclude_none else _model_default,
+        option=_ORJSON_OPTIONS
+    )
+
+
+# Fixed-point scales for data point fields in the MessagePack format: 1e-7 deg
+# (~1 cm) for coordinates, 1e-4 rad for attitude. Sent with each payload.
+_FIXED_POINT_SCALES: Dict[Tuple, float] = {
+    ('gps', 'lat'): 1e7,
+    ('gps', 'lon'): 1e7,
+    ('attitude', 'roll'): 1e4,
+    ('attitude', 'pitch'): 1e4,
+    ('attitude', 'yaw'): 1e4,
+}
+_INT32_LIMIT = 2 ** 31
+
+
+def _flatten_point(point: Dict[str, Any], prefix: Tuple, paths: List[Tuple], values: List[Any]):
+    """Collect the leaf key paths and values of a (nested) data point in order"""
+    for key, value in point.items():
+        path = prefix + (key,)
+        if isinstance(value, dict) and value:
+            _flatten_point(value, path, paths, values)
+        else:
+            paths.append(path)
+            values.append(value)
+
+
+def _scaled_positions(paths, scales: Dict[Tuple, float]) -> List[Tuple[int, float]]:
+    """(row position, scale) of every fixed-point field in a schema"""
+    return [(i, scales[tuple(path)]) for i, path in enumerate(paths, 1) if tuple(path) in scales]
+
+
+def _pack_data_points(points: List[Dict[str, Any]]) -> Tuple[List[Tuple], List[List[Any]]]:
+    """Split data points into shared key schemas and rows of [schema index, *values]
+
+    Points of one batch almost always share a layout, so the key strings are
+    sent once per schema instead of once per point. Values at _FIXED_POINT_SCALES
+    paths are sent as integers (value * scale) when they fit in an int32.
+    """
+    schemas: List[Tuple] = []
+    schema_index: Dict[Tuple, int] = {}
+    schema_scaled: List[List[Tuple[int, float]]] = []
+    rows = []
+    for point in points:
+        paths: List[Tuple] = []
+        row: List[Any] = [0]
+        _flatten_point(point, (), paths, row)
+        key = tuple(paths)
+        index = schema_index.get(key)
+        if index is None:
+            index = schema_index[key] = len(schemas)
+            schemas.append(key)
+            schema_scaled.append(_scaled_positions(key, _FIXED_POINT_SCALES))
+        row[0] = index
+        for i, scale in schema_scaled[index]:
+            value = row[i]
+            if type(value) is int or (type(value) is float and math.isfinite(value)):
+                fixed = round(value * scale)
+                if -_INT32_LIMIT <= fixed < _INT32_LIMIT:
+                    row[i] = fixed
+        rows.append(row)
+    return schemas, rows
+
+
+def _unpack_data_points(schemas: List[List[List[str]]], rows: List[List[Any]],
+                        scales: Optional[Dict[Tuple, float]] = None) -> List[Dict[str, Any]]:
+    """Rebuild nested data points from _pack_data_points output (integers at scaled paths are divided back)"""
+    schema_scaled = [_scaled_positions(paths, scales) if scales else [] for paths in schemas]
+    points = []
+    for row in rows:
+        for i, scale in schema_scaled[row[0]]:
+            if type(row[i]) is int:
+                row[i] = row[i] / scale
+        point: Dict[str, Any] = {}
+        for path, value in zip(schemas[row[0]], islice(row, 1, None)):
+            target = point
+            for key in path[:-1]:
+                target = target.setdefault(key, {})
+            target[path[-1]] = value
+        points.append(point)
+    return points
+
+
+# Columnar telemetry fields: (column, data point section or None for top level, key, dtype)
+_TELEMETRY_COLUMNS = (
+    ('timestamp', None, 'timestamp', np.float64),
+    ('lat', 'gps', 'lat', np.float64),
+    ('lon', 'gps', 'lon', np.float64),
+    ('roll', 'attitude', 'roll', np.float32),
+    ('pitch', 'attitude', 'pitch', np.float32),
+    ('yaw', 'attitude', 'yaw', np.float32),
+)
+
+
+def _column_values(points: List[Dict[str, Any]], section: Optional[str], key: str) -> Iterator[Any]:
+    """Yield one field of every data point, NaN where it is missing"""
+    nan = float('nan')
+    for point in points:
+        if section is not None:
+            point = point.get(section)
+            if not isinstance(point, dict):
+                yield nan
+                continue
+        value = point.get(key)
+        yield nan if value is None else value
+
+
+@dataclass
+class TelemetryColumnar:
+    """Telemetry data points as parallel arrays (NaN where a point lacks the field)"""
+    timestamp: np.ndarray
+    lat: np.ndarray
+    lon: np.ndarray
+    roll: np.ndarray
+    pitch: np.ndarray
+    yaw: np.ndarray
+    
+    @classmethod
+    def from_points(cls, points: List[Dict[str, Any]]) -> "TelemetryColumnar":
+        """Build the columns in one np.fromiter pass per field"""
+        # Values too large for float32 become inf, which validate() reports
+        with np.errstate(over='ignore'):
+            return cls(**{
+                column: np.fromiter(_column_values(points, section, key), dtype=dtype, count=len(points))
+                for column, section, key, dtype in _TELEMETRY_COLUMNS
+            })
+    
+    def validate(self):
+        """Raise ValueError on infinite values or coordinates out of range"""
+        for column in fields(self):
+            if np.isinf(getattr(self, column.name)).any():
+                raise ValueError(f"Data points contain non-finite {column.name} values")
+        # NaN (missing) compares False, so only present values are range-checked
+        if (np.abs(self.lat) > 90).any():
+            raise ValueError("Data point latitude must be between -90 and 90")
+        if (np.abs(self.lon) > 180).any():
+            raise ValueError("Data point longitude must be between -180 and 180")
+    
+    def to_json(self) -> bytes:
+        """Encode as a JSON object of arrays (missing values become null)"""
+        return orjson.dumps(
+            {column.name: getattr(self, column.name) for column in fields(self)},
+            option=_ORJSON_OPTIONS
+        )
+
+
+class DataPointList(list):
+    """List of telemetry data point dicts, accepted without a per-point copy
+    
+    A ``List[Dict[str, Any]]`` field makes pydantic rebuild every point (and
+    re-validate every key) on ingest, which dominates batch parsing. Points
+    are only checked to be dicts here; their values are checked column-wise
+    by TelemetryColumnar in the owning model's validator.
+    """
+    
+    @classmethod
+    def __get_validators__(cls):
+        yield cls.validate
+    
+    @classmethod
+    def __modify_schema__(cls, field_schema):
+        field_schema.update(type='array', items={'type': 'object'})
+    
+    @classmethod
+    def validate(cls, v):
+        if not isinstance(v, (list, tuple)):
+            raise TypeError('data points must be a list')
+        if not all(type(point) is dict for point in v):
+            raise TypeError('each data point must be an object')
+        return v if type(v) is list else list(v)
+
+
+class ORJSONModel(BaseModel):
+    """Base model whose .json() and .parse_raw() go through orjson"""
+    
+    @root_validator(skip_on_failure=True, allow_reuse=True)
+    def intern_identifiers(cls, values):
+        for name in _INTERNED_FIELDS:
+            value = values.get(name)
+            if type(value) is str:
+                values[name] = sys.intern(value)
+        return values
+    
+    class Config:
+        json_loads = orjson.loads
+        json_dumps = _orjson_dumps
+
+
+class GeoPoint(ORJSONModel):
+    """Geographic position"""
+    latitude: float = Field(..., description="Latitude in degrees")
+    longitude: float = Field(..., description="Longitude in degrees")
+    altitude: Optional[float] = Field(None, description="Altitude in meters")
+    
+    class Config:
+        frozen = True
+
 
 # Request Models
-class SyncRequest(BaseModel):
+class SyncRequest(ORJSONModel):
     """Request to sync data with backend"""
     include_status: bool = Field(True, description="Include robot status in sync")
     include_telemetry: bool = Field(True, description="Include telemetry data in sync")
@@ -28,12 +308,12 @@ class SyncRequest(BaseModel):
         }
 
 
-class TelemetryData(BaseModel):
+class TelemetryData(ORJSONModel):
     """Telemetry data for upload"""
     robot_id: str = Field(..., description="Robot identifier")
     start_time: float = Field(..., description="Data collection start timestamp")
     end_time: float = Field(..., description="Data collection end timestamp")
-    data_points: List[Dict[str, Any]] = Field(..., description="Telemetry data points")
+    data_points: DataPointList = Field(..., description="Telemetry data points")
     metadata: Optional[Dict[str, Any]] = Field(None, description="Additional metadata")
     
     @validator('data_points')
@@ -42,6 +322,7 @@ class TelemetryData(BaseModel):
             raise ValueError('At least one data point must be provided')
         if len(v) > 10000:
             raise ValueError('Too many data points (max 10000)')
+        TelemetryColumnar.from_points(v).validate()
         return v
     
     @validator('end_time')
@@ -50,6 +331,38 @@ class TelemetryData(BaseModel):
             raise ValueError('End time must be after start time')
         return v
     
+    def as_columnar(self) -> TelemetryColumnar:
+        """Data points as parallel NumPy arrays"""
+        return TelemetryColumnar.from_points(self.data_points)
+    
+    def to_msgpack(self) -> bytes:
+        """Encode as schema-driven MessagePack (see MSGPACK_CONTENT_TYPE)"""
+        schemas, rows = _pack_data_points(self.data_points)
+        return msgpack.packb({
+            "robot_id": self.robot_id,
+            "start_time": self.start_time,
+            "end_time": self.end_time,
+            "metadata": self.metadata,
+            "scales": [[list(path), scale] for path, scale in _FIXED_POINT_SCALES.items()],
+            "schemas": schemas,
+            "rows": rows
+        }, use_bin_type=True)
+    
+    @classmethod
+    def from_msgpack(cls, data: bytes) -> "TelemetryData":
+        """Decode a payload produced by to_msgpack"""
+        payload = msgpack.unpackb(data, raw=False)
+        return cls(
+            robot_id=payload["robot_id"],
+            start_time=payload["start_time"],
+            end_time=payload["end_time"],
+            data_points=_unpack_data_points(
+                payload["schemas"], payload["rows"],
+                {tuple(path): scale for path, scale in payload.get("scales", ())}
+            ),
+            metadata=payload.get("metadata")
+        )
+    
     class Config:
         schema_extra = {
             "example": {
@@ -68,7 +381,7 @@ class TelemetryData(BaseModel):
         }
 
 
-class CommandReceived(BaseModel):
+class CommandReceived(ORJSONModel):
     """Command execution result for acknowledgment"""
     success: bool = Field(..., description="Whether command executed successfully")
     message: str = Field(..., description="Execution result message")
@@ -89,7 +402,7 @@ class CommandReceived(BaseModel):
 
 
 # Response Models
-class SyncResponse(BaseModel):
+class SyncResponse(ORJSONModel):
     """Response from backend sync operation"""
     success: bool = Field(..., description="Whether sync was successful")
     message: str = Field(..., description="Sync result message")
@@ -111,7 +424,7 @@ class SyncResponse(BaseModel):
         }
 
 
-class BackendConnection(BaseModel):
+class BackendConnection(ORJSONModel):
     """Backend connection status"""
     connected: bool = Field(..., description="Whether connected to backend")
     url: str = Field(..., description="Backend URL")
@@ -119,14 +432,7 @@ class BackendConnection(BaseModel):
     last_sync: Optional[float] = Field(None, description="Last successful sync timestamp")
     sync_interval: float = Field(..., description="Sync interval in seconds")
     api_version: str = Field(..., description="Backend API version")
-    status: str = Field(..., description="Connection status")
-    
-    @validator('status')
-    def validate_status(cls, v):
-        valid_statuses = ["connected", "disconnected", "error", "authenticating"]
-        if v not in valid_statuses:
-            raise ValueError(f"Status must be one of: {valid_statuses}")
-        return v
+    status: ConnectionStatus = Field(..., description="Connection status")
     
     class Config:
         schema_extra = {
@@ -142,7 +448,7 @@ class BackendConnection(BaseModel):
         }
 
 
-class DataUpload(BaseModel):
+class DataUpload(ORJSONModel):
     """Data upload response"""
     success: bool = Field(..., description="Whether upload was successful")
     message: str = Field(..., description="Upload result message")
@@ -162,7 +468,7 @@ class DataUpload(BaseModel):
         }
 
 
-class RobotStatus(BaseModel):
+class RobotStatus(ORJSONModel):
     """Robot status for backend reporting"""
     robot_id: str = Field(..., description="Robot identifier")
     timestamp: float = Field(..., description="Status timestamp")
@@ -171,7 +477,7 @@ class RobotStatus(BaseModel):
     armed: bool = Field(..., description="Whether motors are armed")
     battery_voltage: Optional[float] = Field(None, description="Battery voltage")
     battery_percentage: Optional[float] = Field(None, description="Battery percentage")
-    location: Optional[Dict[str, float]] = Field(None, description="Current GPS location")
+    location: Optional[GeoPoint] = Field(None, description="Current GPS location")
     altitude: Optional[float] = Field(None, description="Current altitude")
     speed: Optional[float] = Field(None, description="Current ground speed")
     heading: Optional[float] = Field(None, description="Current heading")
@@ -206,29 +512,62 @@ class RobotStatus(BaseModel):
 
 
 # Command Models
-class BackendCommand(BaseModel):
+class SetModeParams(ORJSONModel):
+    """Parameters of a set_mode command"""
+    mode: str = Field(..., description="Flight mode name")
+    
+    class Config:
+        frozen = True
+
+
+class ArmParams(ORJSONModel):
+    """Parameters of an arm_motors command"""
+    arm: bool = Field(True, description="Arm (True) or disarm (False)")
+    
+    class Config:
+        frozen = True
+
+
+class GotoParams(GeoPoint):
+    """Parameters of a goto_position command"""
+    altitude: float = Field(10.0, description="Target altitude in meters")
+
+
+# Typed parameter models by command type; other commands keep a plain dict
+_COMMAND_PARAMETERS: Dict[str, Type[ORJSONModel]] = {
+    "set_mode": SetModeParams,
+    "arm_motors": ArmParams,
+    "goto_position": GotoParams,
+}
+
+
+class BackendCommand(ORJSONModel):
     """Command received from backend"""
     id: str = Field(..., description="Command unique identifier")
-    type: str = Field(..., description="Command type")
-    priority: int = Field(1, description="Command priority (1=low, 5=high)", ge=1, le=5)
-    parameters: Dict[str, Any] = Field(..., description="Command parameters")
+    type: CommandType = Field(..., description="Command type")
+    priority: conint(ge=1, le=5) = Field(1, description="Command priority (1=low, 5=high)")
+    parameters: Union[GotoParams, SetModeParams, ArmParams, Dict[str, Any]] = Field(..., description="Command parameters")
     timeout: Optional[float] = Field(None, description="Command timeout in seconds")
-    retry_count: int = Field(0, description="Number of retries allowed", ge=0, le=5)
+    retry_count: conint(ge=0, le=5) = Field(0, description="Number of retries allowed")
     created_at: float = Field(..., description="Command creation timestamp")
     expires_at: Optional[float] = Field(None, description="Command expiration timestamp")
     
-    @validator('type')
-    def validate_command_type(cls, v):
-        valid_types = [
-            "set_mode", "arm_motors", "disarm_motors", "takeoff", "land", "rtl",
-            "goto_position", "set_speed", "emergency_stop", "start_mission",
-            "stop_mission", "update_config", "reboot", "diagnostics"
-        ]
-        if v not in valid_types:
-            raise ValueError(f"Command type must be one of: {valid_types}")
-        return v
+    @validator('parameters', pre=True)
+    def parse_parameters(cls, v, values):
+        # Pick the parameter model from the command type instead of letting
+        # the Union try each member in turn
+        model = _COMMAND_PARAMETERS.get(values.get('type'))
+        if model is None or isinstance(v, model):
+            return v
+        return model.parse_obj(v)
     
     class Config:
+        smart_union = True
+        # Commands are never mutated after receipt; frozen also lets CommandQueue
+        # hold them without the defensive copy pydantic makes on nested validation
+        frozen = True
+        extra = "ignore"
+        copy_on_model_validation = 'none'
         schema_extra = {
             "example": {
                 "id": "cmd_001_1640995200",
@@ -247,7 +586,7 @@ class BackendCommand(BaseModel):
         }
 
 
-class CommandQueue(BaseModel):
+class CommandQueue(ORJSONModel):
     """Command queue status"""
     pending_commands: List[BackendCommand] = Field(..., description="Pending commands")
     executing_command: Optional[BackendCommand] = Field(None, description="Currently executing command")
@@ -270,7 +609,7 @@ class CommandQueue(BaseModel):
 
 
 # Advanced Models
-class BackendMetrics(BaseModel):
+class BackendMetrics(ORJSONModel):
     """Backend communication metrics"""
     total_requests: int = Field(..., description="Total requests sent")
     successful_requests: int = Field(..., description="Successful requests")
@@ -282,15 +621,18 @@ class BackendMetrics(BaseModel):
     data_downloaded_bytes: int = Field(..., description="Total data downloaded in bytes")
     sync_count: int = Field(..., description="Number of sync operations")
     command_count: int = Field(..., description="Number of commands received")
+    success_rate: float = Field(0.0, description="Request success rate percentage (derived)")
     
-    @property
-    def success_rate(self) -> float:
-        """Calculate request success rate"""
-        if self.total_requests == 0:
-            return 0.0
-        return (self.successful_requests / self.total_requests) * 100
+    @root_validator(skip_on_failure=True)
+    def compute_success_rate(cls, values):
+        # Computed once per snapshot (0.0 when there were no requests) and
+        # stored as a field, so reads and serialization are plain lookups
+        values['success_rate'] = 100.0 * values['successful_requests'] / max(values['total_requests'], 1)
+        return values
     
     class Config:
+        # A metrics snapshot; frozen so the derived success_rate stays consistent
+        frozen = True
         schema_extra = {
             "example": {
                 "total_requests": 1000,
@@ -307,7 +649,7 @@ class BackendMetrics(BaseModel):
         }
 
 
-class BackendHealth(BaseModel):
+class BackendHealth(ORJSONModel):
     """Backend service health status"""
     api_available: bool = Field(..., description="Whether API is available")
     database_connected: bool = Field(..., description="Whether database is connected")
@@ -316,14 +658,7 @@ class BackendHealth(BaseModel):
     error_rate: float = Field(..., description="Error rate percentage")
     last_health_check: float = Field(..., description="Last health check timestamp")
     version: str = Field(..., description="Backend service version")
-    status: str = Field(..., description="Overall backend health status")
-    
-    @validator('status')
-    def validate_status(cls, v):
-        valid_statuses = ["healthy", "degraded", "unhealthy", "unreachable"]
-        if v not in valid_statuses:
-            raise ValueError(f"Status must be one of: {valid_statuses}")
-        return v
+    status: HealthStatus = Field(..., description="Overall backend health status")
     
     class Config:
         schema_extra = {
@@ -340,7 +675,7 @@ class BackendHealth(BaseModel):
         }
 
 
-class SyncHistory(BaseModel):
+class SyncHistory(ORJSONModel):
     """Sync operation history"""
     sync_id: str = Field(..., description="Sync operation identifier")
     timestamp: float = Field(..., description="Sync timestamp")
@@ -366,30 +701,17 @@ class SyncHistory(BaseModel):
         }
 
 
-class DataStream(BaseModel):
+class DataStream(ORJSONModel):
     """Real-time data stream configuration"""
     stream_id: str = Field(..., description="Stream identifier")
-    data_type: str = Field(..., description="Type of data being streamed")
+    data_type: StreamDataType = Field(..., description="Type of data being streamed")
     enabled: bool = Field(..., description="Whether stream is enabled")
-    interval_seconds: float = Field(..., description="Stream interval in seconds")
+    interval_seconds: confloat(ge=0.1, le=3600) = Field(..., description="Stream interval in seconds")
     last_update: Optional[float] = Field(None, description="Last update timestamp")
     buffer_size: int = Field(..., description="Stream buffer size")
     compression_enabled: bool = Field(False, description="Whether compression is enabled")
     encryption_enabled: bool = Field(False, description="Whether encryption is enabled")
     
-    @validator('data_type')
-    def validate_data_type(cls, v):
-        valid_types = ["gps", "telemetry", "status", "logs", "camera", "sensors"]
-        if v not in valid_types:
-            raise ValueError(f"Data type must be one of: {valid_types}")
-        return v
-    
-    @validator('interval_seconds')
-    def validate_interval(cls, v):
-        if not (0.1 <= v <= 3600):
-            raise ValueError("Interval must be between 0.1 and 3600 seconds")
-        return v
-    
     class Config:
         schema_extra = {
             "example": {
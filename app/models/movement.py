@@ -2,9 +2,9 @@
 Pydantic models for movement control API endpoints
 """
 
+import time
 from typing import Optional, Dict, Any
 from pydantic import BaseModel, Field, validator
-from datetime import datetime
 
 
 # Request Models
@@ -137,7 +137,7 @@ class MoveToResponse(BaseModel):
     distance_to_target: float = Field(..., description="Distance to target in meters")
     estimated_time_seconds: float = Field(..., description="Estimated time to reach target")
     max_speed: float = Field(..., description="Maximum speed setting")
-    timestamp: datetime = Field(default_factory=datetime.now, description="Command timestamp")
+    timestamp: float = Field(default_factory=time.time, description="Command timestamp (Unix)")
 
 
 class PositionResponse(BaseModel):
@@ -2,10 +2,10 @@
 Pydantic models for Pixhawk-related API endpoints
 """
 
+import time
 from typing import Optional, Dict, Any, List
 from enum import Enum
 from pydantic import BaseModel, Field, validator
-from datetime import datetime
 
 
 class FlightMode(str, Enum):
@@ -110,7 +110,7 @@ class CommandResponse(BaseModel):
     success: bool = Field(..., description="Whether the command succeeded")
     message: str = Field(..., description="Human-readable message")
     data: Optional[Dict[str, Any]] = Field(None, description="Additional response data")
-    timestamp: datetime = Field(default_factory=datetime.now, description="Response timestamp")
+    timestamp: float = Field(default_factory=time.time, description="Response timestamp (Unix)")
     
     class Config:
         schema_extra = {
@@ -118,7 +118,7 @@ class CommandResponse(BaseModel):
                 "success": True,
                 "message": "Command executed successfully",
                 "data": {"parameter": "value"},
-                "timestamp": "2024-01-01T12:00:00"
+                "timestamp": 1640995200.0
             }
         }
 
@@ -12,8 +12,8 @@ class MissionService:
         self.planner.create_mission(waypoints)
         return self.planner.get_current_mission()
 
-    def execute_mission(self):
-        return self.planner.execute_mission()
+    async def execute_mission(self, mavlink_manager):
+        return await self.planner.execute_mission(mavlink_manager)
 
     def get_current_mission(self):
         return self.planner.get_current_mission()
@@ -4,6 +4,7 @@ Telemetry collection and management service
 
 import asyncio
 import logging
+import sys
 import time
 from typing import Dict, Any, List, Optional, Callable
 from collections import deque
@@ -16,8 +17,11 @@ from config.settings import get_settings
 
 logger = logging.getLogger(__name__)
 
+# dataclass slots are only available from Python 3.10
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(frozen=True, **_SLOTS)
 class TelemetryDataPoint:
     """Single telemetry data point"""
     timestamp: float
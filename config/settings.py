@@ -63,6 +63,10 @@ class Settings(BaseSettings):
     BACKEND_TIMEOUT: float = 10.0
     BACKEND_RETRY_ATTEMPTS: int = 3
     BACKEND_SYNC_INTERVAL: float = 30.0  # seconds
+    BACKEND_TELEMETRY_MSGPACK: bool = False  # binary telemetry uploads (JSON when off)
+    BACKEND_COMPRESSION: bool = False  # Content-Encoding on upload bodies (zstd if installed, else gzip)
+    BACKEND_COMPRESSION_MIN_BYTES: int = 1024  # smaller bodies are sent as-is
+    BACKEND_HEARTBEAT_BATCH: bool = False  # backend accepts /heartbeat/batch for missed beats
     
     # Robot identification
     ROBOT_ID: str = "agrobot-rpi-001"
@@ -5,7 +5,8 @@ Main entry point for the Raspberry Pi controller application
 """
 
 import uvicorn
-from fastapi import FastAPI, Depends, WebSocket, WebSocketDisconnect
+from fastapi import FastAPI, Depends, Response, WebSocket, WebSocketDisconnect
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.openapi.docs import get_swagger_ui_html
 from fastapi.staticfiles import StaticFiles
@@ -86,6 +87,7 @@ def create_app() -> FastAPI:
         docs_url="/docs",  # Swagger UI
         redoc_url="/redoc",  # ReDoc UI
         openapi_url="/openapi.json",  # OpenAPI schema
+        default_response_class=ORJSONResponse,
         lifespan=lifespan
     )
     
@@ -150,8 +152,7 @@ def create_app() -> FastAPI:
         try:
             if not mavlink_manager:
                 return {"error": "MAVLink manager not initialized"}
-            status_data = mavlink_manager.get_status()
-            return status_data
+            return Response(content=mavlink_manager.get_status_json(), media_type="application/json")
         except Exception as e:
             logger.error(f"Pixhawk status error: {e}")
             return {"error": str(e)}
@@ -320,5 +321,6 @@ if __name__ == "__main__":
         port=settings.PORT,
         reload=settings.DEBUG,
         log_level="info" if not settings.DEBUG else "debug",
+        loop="auto",  # uvloop when installed (uvicorn[standard]), asyncio otherwise
         workers=1  # Single worker for better stability
     )
\ No newline at end of file